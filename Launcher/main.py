@@ -4,16 +4,17 @@ This module provides the main entry point for the application.
 Logging is configured and the main application loop is started.
 """
 
+import atexit
 import logging
 import logging.config
 import logging.handlers
-from datetime import datetime
+import heapq
 import os
+import queue
 import sys
-import psutil
+import threading
+import time
 from source import path
-from source.gui.app_win import App
-from source.gui.popup_win import StandalonePopupWindow
 
 IS_DEVELOPMENT = False  # This should be set to False before release
 
@@ -27,75 +28,145 @@ class ErrorTrackingHandler(logging.Handler):
 
     def emit(self, record):
         if record.levelno >= logging.ERROR:
-            self.errors.append(record)
+            # Keep the formatted text, the record would keep any traceback frames alive
+            self.errors.append(self.format(record))
             self.error_occurred = True
 
 
+def prune_old_logs(log_directory: os.PathLike, backup_count: int, current_log: str):
+    """
+    Remove the oldest log files until at most backup_count remain.
+
+    Parameters:
+    - log_directory (os.PathLike): The directory containing the log files.
+    - backup_count (int): The number of log files to keep, including the current one.
+    - current_log (str): The file name of the log in use, which is never removed.
+    """
+    with os.scandir(log_directory) as entries:
+        log_files = [
+            entry for entry in entries
+            if entry.name.startswith("hominum_") and entry.name.endswith(".log")
+            and entry.name != current_log
+        ]
+    excess = len(log_files) - backup_count + 1  # +1 to account for the current log
+    if excess > 0:
+        # Remove the oldest logs until the limit is satisfied
+        for log_file_entry in heapq.nsmallest(excess, log_files, key=lambda e: e.stat().st_mtime):
+            try:
+                os.remove(log_file_entry.path)
+            except OSError as error:
+                logging.getLogger(__name__).warning(
+                    "Failed to remove old log '%s': %s", log_file_entry.name, error
+                )
+
+
 def configure_logging():
     """
     Configures the logging for the application.
 
+    Records are put on a queue by the root logger and written to disk by a
+    background listener so that logging calls do not block the calling thread.
+
     Returns:
     - ErrorTrackingHandler: The error tracking handler used to track if an error occurred.
+    - QueueListener: The started listener that writes queued records, stop it before exiting.
     """
     log_directory = path.APPLICATION_DIR / "logs"
     log_directory.mkdir(parents=True, exist_ok=True)
 
     # Naming the log file with a timestamp to ensure uniqueness
-    timestamp = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
+    timestamp = time.strftime("%Y-%m-%d_%H-%M-%S")
     log_file = log_directory / f"hominum_{timestamp}.log"
 
-    # Limit the amount of log files
-    backup_count = 10
-    log_files = os.listdir(log_directory)
-    if len(log_files) >= backup_count:
-        log_files.sort()  # Sort by creation time
-        # Remove oldest logs until the limit is satisfied
-        for _ in range((len(log_files) - backup_count) + 1):  # +1 to account for the latest log
-            os.remove(os.path.join(log_directory, log_files.pop(0)))  # Remove the oldest log
-
-    log_formatter = logging.Formatter(
-        "%(asctime)s | %(levelname)-8s | %(filename)-8s %(funcName)-10s %(lineno)04d | %(message)s",
-        datefmt="%Y:%m:%d %H:%M:%S",
-    )
+    # Thread and process info is never logged, skip collecting it for every record
+    logging.logThreads = False
+    logging.logProcesses = False
+    logging.logMultiprocessing = False
+
+    if IS_DEVELOPMENT:
+        log_format = \
+            "%(asctime)s | %(levelname)-8s | %(filename)-8s %(funcName)-10s %(lineno)04d | %(message)s"
+    else:
+        # Skip the stack walk that finds the file, function, and line of every record
+        logging._srcfile = None  # pylint: disable=protected-access
+        log_format = "%(asctime)s | %(levelname)-8s | %(name)-24s | %(message)s"
+    log_formatter = logging.Formatter(log_format, datefmt="%Y:%m:%d %H:%M:%S")
 
     error_tracker = ErrorTrackingHandler()
     error_tracker.setFormatter(log_formatter)
 
-    file_handler = logging.FileHandler(log_file)
+    # The file is opened on the first write, records are written in batches
+    file_handler = logging.FileHandler(log_file, delay=True)
     file_handler.setFormatter(log_formatter)
+    buffered_file_handler = logging.handlers.MemoryHandler(
+        capacity=256, flushLevel=logging.ERROR, target=file_handler, flushOnClose=True
+    )
+    atexit.register(buffered_file_handler.flush)
 
     console_handler = logging.StreamHandler()
     console_handler.setFormatter(log_formatter)
 
+    output_handlers = [buffered_file_handler]
+    if IS_DEVELOPMENT:
+        output_handlers.append(console_handler)
+
+    log_queue = queue.Queue(-1)
+    queue_handler = logging.handlers.QueueHandler(log_queue)
+    log_listener = logging.handlers.QueueListener(
+        log_queue, *output_handlers, respect_handler_level=True
+    )
+
     # setup logging for the application
     root_logger = logging.getLogger()
-    root_logger.setLevel(logging.DEBUG)
+    # Debug records are only kept in development, this lets debug calls return early otherwise
+    root_logger.setLevel(logging.DEBUG if IS_DEVELOPMENT else logging.INFO)
     logging.getLogger("urllib3.connectionpool").setLevel(logging.WARNING)  # Mute connectionpool
     logging.getLogger("httpx").setLevel(logging.WARNING)  # Mute httpx
     logging.getLogger("http").setLevel(logging.WARNING)  # Mute http
     root_logger.addHandler(error_tracker)  # Attach the error handler to the root logger
-    root_logger.addHandler(file_handler)
-    if IS_DEVELOPMENT:
-        root_logger.addHandler(console_handler)
+    root_logger.addHandler(queue_handler)  # File and console output is handled by the listener
+    log_listener.start()
 
-    return error_tracker
+    # Limit the amount of log files without holding up startup
+    backup_count = 10
+    threading.Thread(
+        target=prune_old_logs, args=(log_directory, backup_count, log_file.name), daemon=True
+    ).start()
 
+    return error_tracker, log_listener
 
-def is_process_running():
-    """Check if there is any running process that contains the given name process_name."""
-    process_names = ["hominum", "hominum.exe"]  # TODO: Make sure this is cross-platform
-    appearance_count = 0
+
+def iter_process_names():
+    """
+    Yield the pid and lowercase name of every running process.
+
+    On Linux the names are read straight from /proc, psutil is only imported on other platforms.
+    """
+    if sys.platform.startswith("linux"):
+        for pid in os.listdir("/proc"):
+            if not pid.isdigit():
+                continue
+            try:
+                with open(f"/proc/{pid}/comm", "r", encoding="utf-8") as comm_file:
+                    name = comm_file.read().strip()
+            except OSError:  # The process ended or is not accessible
+                continue
+            yield int(pid), name.lower()
+        return
+
+    import psutil  # pylint: disable=import-outside-toplevel
     for proc in psutil.process_iter(['name']):
-        try:
-            for process_name in process_names:
-                if process_name.lower() in proc.info['name'].lower():
-                    appearance_count += 1
-                    if appearance_count > 1:
-                        return True
-                break
-        except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
-            pass
+        yield proc.pid, (proc.info.get('name') or '').lower()
+
+
+def is_process_running():
+    """Check if there is another running process of the launcher."""
+    process_names = ("hominum", "hominum.exe")  # TODO: Make sure this is cross-platform
+    # Skip this process and its parent, which is the bootloader when frozen
+    own_pids = {os.getpid(), os.getppid()}
+    for pid, name in iter_process_names():
+        if pid not in own_pids and name.endswith(process_names):
+            return True
     return False
 
 
@@ -105,9 +176,16 @@ def exit_application(code: int=0):
 
 
 if __name__ == "__main__":
-    application_errors = configure_logging()
+    application_errors, log_listener = configure_logging()
     logger = logging.getLogger(__name__)
 
+    # Imported once logging is configured, the settings are loaded when the GUI modules are
+    # imported and anything logged while loading them would otherwise be lost
+    # pylint: disable=wrong-import-position
+    from source.gui.app_win import App
+    from source.gui.popup_win import StandalonePopupWindow
+    # pylint: enable=wrong-import-position
+
     # log constants
     logger.info("PROGRAM_NAME: %s", path.PROGRAM_NAME)
     logger.info("PROGRAM_NAME_LONG: %s", path.PROGRAM_NAME_LONG)
@@ -120,6 +198,7 @@ if __name__ == "__main__":
     logger.info("WORK_DIR: %s", path.WORK_DIR)
     logger.info("CONTEXT: %s", path.CONTEXT)
 
+    exit_code = 0
     try:
         logger.info("Starting application")
 
@@ -137,11 +216,13 @@ if __name__ == "__main__":
         if application_errors.error_occurred:
             logger.warning("Application finished with errors")
             for error in application_errors.errors:
-                logger.warning(error)
-            exit_application(1)
+                logger.warning("%s", error)
+            exit_code = 1
         else:
             logger.info("Application finished successfully")
-            exit_application(0)
     except Exception as e:
         logger.exception("An unhandled exception occurred")
-        exit_application(1)
+        exit_code = 1
+    finally:
+        log_listener.stop()  # Drain the queue before exiting
+    exit_application(exit_code)
@@ -11,8 +11,6 @@ Classes:
 
 import logging
 
-logger = logging.getLogger(__name__)
-
 
 class DownloadError(Exception):
     """Raised when a download fails."""
@@ -33,5 +31,7 @@ class RemoteError(Exception):
 class GlobalKill(Exception):
     """Raised when a global kill is requested."""
     def __init__(self, message: str = "Global kill requested"):
-        logger.debug(message)
-        super().__init__()
+        logger = logging.getLogger(__name__)  # Only looked up when the exception is raised
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(message)
+        super().__init__(message)
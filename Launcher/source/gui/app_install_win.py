@@ -5,15 +5,36 @@ classes:
 - InstallWindow: A class that displays the installation progress across operations.
 """
 
+import concurrent.futures
 import logging
+import time
 import customtkinter
+from portablemc.standard import VersionNotFoundError, TooMuchParentsError, \
+    JarNotFoundError, JvmNotFoundError
 from source.gui.popup_win import PopupWindow
-from source import utils, path, exceptions
-from source.mc.authentication import AuthenticationHandler
-from source.mc.minecraft import MCManager, InstallWatcher
+from source import utils, exceptions
+from source.mc.authentication import get_auth_handler
+from source.mc.minecraft import InstallWatcher, get_mc, request_global_kill, clear_global_kill
 
 logger = logging.getLogger(__name__)
 
+SETTINGS = utils.Settings()
+
+GUI_REFRESH_INTERVAL = 16  # Milliseconds between GUI refreshes, about one frame
+PROVISION_ATTEMPTS = 3  # Times to try provisioning the environment
+PROVISION_BACKOFF = 0.5  # Seconds to wait before the first retry, doubled after each attempt
+# Errors that will fail the same way if provisioning is retried, a bad games entry in the
+# remote config or a version, parent, jar, or java that doesn't exist
+NON_RETRYABLE_ERRORS = (
+    KeyError, ValueError,
+    VersionNotFoundError, TooMuchParentsError, JarNotFoundError, JvmNotFoundError,
+)
+
+# Runs provisioning and syncing off the Tk thread, one install at a time
+INSTALL_EXECUTOR = concurrent.futures.ThreadPoolExecutor(
+    max_workers=1, thread_name_prefix="install"
+)
+
 
 class InstallWindow(customtkinter.CTkToplevel):
     """A class that displays the installation progress accross operations."""
@@ -21,7 +42,8 @@ class InstallWindow(customtkinter.CTkToplevel):
         super().__init__()
         logger.debug("Creating install window")
 
-        self.settings = utils.Settings()
+        self.last_refresh = 0.0
+        self.refresh_scheduled = False
 
         self.title("Install")
         self.resizable(False, False)
@@ -32,24 +54,13 @@ class InstallWindow(customtkinter.CTkToplevel):
         self.grid_rowconfigure(1, weight=1)
         self.grid_rowconfigure(2, weight=1)
 
-        self.mc = MCManager(context=path.CONTEXT)
-        self.auth_handler = AuthenticationHandler(
-            email=self.settings.get_user("email"), context=path.CONTEXT
-        )
-        try:
-            self.version = self.mc.provision_version(autojoin=self.settings.get_game("autojoin"))
-        except Exception as version_error:
-            logger.error("Error getting version: %s", version_error)
-            version_popup_window = PopupWindow(
-                self,
-                title="Version Error",
-                message="An error occurred while getting the version. Please try again.",
-            )
-            version_popup_window.wait_window()
-            self.version = None
-
+        self.mc = None  # Fetched again when the install starts
+        self.auth_handler = get_auth_handler(SETTINGS.get_user("email"))
+        self.version = None
+        self.install_future = None
         self.environment = None
         self.errors_occurred = False
+        self.closed = False  # Set once the window is destroyed
 
         self.session = self.auth_handler.get_session()
         if self.session is None:
@@ -62,15 +73,21 @@ class InstallWindow(customtkinter.CTkToplevel):
             auth_popup_window.wait_window()
             self.session = None
 
+        # Hidden until built, only after the session check since a popup over a hidden window
+        # would be hidden too
+        self.withdraw()
+
+        gui = SETTINGS.snapshot_gui()
+
         # Title label
         self.title_label = customtkinter.CTkLabel(
-            self, text="Please Wait", font=self.settings.get_gui("font_large")
+            self, text="Please Wait", font=gui.font_large
         )
         self.title_label.grid(row=0, column=0, padx=20, pady=(20, 0))
 
         # Item Download Label
         self.download_item_label = customtkinter.CTkLabel(
-            self, text="Getting things ready", font=self.settings.get_gui("font_normal")
+            self, text="Getting things ready", font=gui.font_normal
         )
         self.download_item_label.grid(row=1, column=0, padx=20, pady=10)
 
@@ -79,7 +96,9 @@ class InstallWindow(customtkinter.CTkToplevel):
         self.progress_bar.grid(row=2, column=0, columnspan=2, padx=20, pady=(0, 20), sticky="ew")
         self.progress_bar.start()
 
-        if self.version and self.session:
+        self.deiconify()
+
+        if self.session:
             self.after(100, self.install)
         else:
             self.after(100, self.destroy)
@@ -89,10 +108,48 @@ class InstallWindow(customtkinter.CTkToplevel):
     def install(self):
         """Install the game and other necessary files."""
         logger.info("Starting Installation")
+        try:
+            # Refetch the remote tree and config, the sync should not use data from when the
+            # launcher was started
+            get_mc.cache_clear()
+            self.mc = get_mc()
+            self.version = self.mc.provision_version(autojoin=SETTINGS.get_game("autojoin"))
+        except Exception as version_error:
+            logger.error("Error getting version: %s", version_error)
+            version_popup_window = PopupWindow(
+                self,
+                title="Version Error",
+                message="An error occurred while getting the version. Please try again.",
+            )
+            version_popup_window.wait_window()
+            self.destroy()
+            return
+
+        self.install_future = INSTALL_EXECUTOR.submit(self.run_install)
+        self.after(50, self.poll_install)
+
+    def run_install(self):
+        """
+        Provision the environment and sync the files.
+        This runs in a worker thread, GUI updates are passed back to the main thread.
+
+        Returns:
+        - Environment: The provisioned environment.
+        - None: If the environment could not be provisioned.
+        """
         version_environment = None
+        # A kill from an earlier install is over, this install only stops if its window closes
+        clear_global_kill()
+        if self.closed:
+            raise exceptions.GlobalKill()
+        if self.session is None:  # Every attempt would fail the same way
+            logger.error("No authentication session, not provisioning the environment")
+            self.errors_occurred = True
+            return version_environment
+
         # Install the game
         install_watcher = InstallWatcher(self)
-        for _ in range(3):  # Retry 3 times
+        for attempt in range(PROVISION_ATTEMPTS):
             try:
                 logger.info("Provisioning Environment")
                 version_environment = self.mc.provision_environment(
@@ -103,28 +160,72 @@ class InstallWindow(customtkinter.CTkToplevel):
                 self.errors_occurred = False
                 logger.info("Environment provisioned successfully")
                 break
+            except exceptions.GlobalKill:
+                self.errors_occurred = True
+                raise
+            except NON_RETRYABLE_ERRORS as env_error:
+                logger.error("Error provisioning environment, not retrying: %s", env_error)
+                self.errors_occurred = True
+                break
             except Exception as env_error:
-                if isinstance(env_error, exceptions.GlobalKill):
-                    self.errors_occurred = True
-                    return
                 logger.error("Error provisioning environment: %s", env_error)
                 self.errors_occurred = True
+                if attempt < PROVISION_ATTEMPTS - 1:
+                    backoff = PROVISION_BACKOFF * 2 ** attempt
+                    logger.warning(
+                        "Provisioning attempt %d of %d failed, retrying in %.1f seconds",
+                        attempt + 1, PROVISION_ATTEMPTS, backoff
+                    )
+                    time.sleep(backoff)
 
         # Prevent the next steps because the environment was not provisioned properly
         if self.errors_occurred:
             logger.warning("Environment was not provisioned properly, stopping installation")
-        else:
-            try:
-                sync_thread = utils.PropagatingThread(target=self.mc.sync, args=(self,))
-                sync_thread.start()
-
-                while sync_thread.is_alive():
-                    self.update_gui()
-                sync_thread.join()
-            except Exception as sync_error:
-                logger.error("Error syncing files: %s", sync_error)
-                self.errors_occurred = True
+            return version_environment
+
+        try:
+            self.mc.sync(self)
+        except exceptions.GlobalKill:
+            self.errors_occurred = True
+            raise
+        except Exception as sync_error:
+            logger.error("Error syncing files: %s", sync_error)
+            self.errors_occurred = True
+
+        return version_environment
+
+    def poll_install(self):
+        """Check on the install worker without blocking the event loop."""
+        if self.closed:  # The worker was asked to stop, there is nothing left to report
+            return
+        if not self.install_future.done():
+            self.after(50, self.poll_install)
+            return
+
+        try:
+            version_environment = self.install_future.result()
+        except exceptions.GlobalKill:
+            return
+        except Exception as install_error:
+            logger.error("Error installing: %s", install_error)
+            self.errors_occurred = True
+            version_environment = None
+
+        self.finish_install(version_environment)
 
+    def destroy(self):
+        """
+        Destroy the window.
+        This overrides the default destroy method to stop an install that is still running.
+        """
+        self.closed = True
+        if self.install_future is not None and not self.install_future.done():
+            logger.info("Install window closed, stopping the installation")
+            request_global_kill()
+        super().destroy()
+
+    def finish_install(self, version_environment):
+        """Report the result of the installation and close the window."""
         if not version_environment:
             logger.warning("Environment is not set")
 
@@ -142,39 +243,73 @@ class InstallWindow(customtkinter.CTkToplevel):
             install_error_popup.wait_window()
         self.destroy()
 
+    @utils.run_in_main_thread
     def update_gui(self):
-        """Update the GUI."""
-        self.update()
+        """
+        Update the GUI.
+
+        Refreshes are coalesced to at most one per frame. A refresh requested
+        too soon after the last one is deferred and flushed by the event loop.
+        """
+        elapsed = (time.monotonic() - self.last_refresh) * 1000
+        if elapsed >= GUI_REFRESH_INTERVAL:
+            self.flush_gui()
+        elif not self.refresh_scheduled:
+            self.refresh_scheduled = True
+            self.after(GUI_REFRESH_INTERVAL, self.flush_gui)
+
+    def flush_gui(self):
+        """Refresh the GUI immediately."""
+        self.refresh_scheduled = False
+        self.last_refresh = time.monotonic()
         self.update_idletasks()
 
+    @utils.run_in_main_thread
     def update_title(self, text):
         """Update the title label."""
         self.title_label.configure(text=text)
-        logger.debug("Title set to '%s'", text)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Title set to '%s'", text)
         self.update_gui()
 
+    @utils.run_in_main_thread
     def update_item(self, text):
         """Update the item label."""
         self.download_item_label.configure(text=text)
-        logger.debug("Item set to '%s'", text)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Item set to '%s'", text)
         self.update_gui()
 
+    @utils.run_in_main_thread
     def reset_progress(self):
         """Reset the progress bar."""
         self.progress_bar.stop()
         self.progress_bar.configure(mode="determinate")
         self.progress_bar.set(0)
-        logger.debug("Progress bar reset")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Progress bar reset")
         self.update_gui()
 
+    @utils.run_in_main_thread
     def progress_indeterminate(self):
         """Sets the progress bar to be indeterminate"""
         self.progress_bar.configure(mode="indeterminate")
         self.progress_bar.start()
         self.update_gui()
 
+    @utils.run_in_main_thread
     def update_progress(self, value):
         """Update the progress bar."""
         self.progress_bar.set(value)
-        logger.debug("Progress set to '%s'", value)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Progress set to '%s'", value)
+        self.update_gui()
+
+    @utils.run_in_main_thread
+    def update_status(self, item, value):
+        """Update the item label and the progress bar with a single GUI refresh."""
+        self.download_item_label.configure(text=item)
+        self.progress_bar.set(value)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Status set to '%s' at '%s'", item, value)
         self.update_gui()
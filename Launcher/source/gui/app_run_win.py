@@ -14,6 +14,8 @@ from source import utils
 
 logger = logging.getLogger(__name__)
 
+SETTINGS = utils.Settings()
+
 
 class RunWindow(customtkinter.CTkToplevel):
     """A class that is used to run the game."""
@@ -21,8 +23,6 @@ class RunWindow(customtkinter.CTkToplevel):
         super().__init__()
         logger.debug("Creating game window")
 
-        self.settings = utils.Settings()
-
         if not environment:
             env_popup_window = PopupWindow(
                 self,
@@ -34,6 +34,7 @@ class RunWindow(customtkinter.CTkToplevel):
             super().destroy()
             return
 
+        self.withdraw()  # Hidden until built so the window is drawn once
         self.environment = environment
         self.kill_process = False  # Used by EnvironmentRunner
 
@@ -44,18 +45,21 @@ class RunWindow(customtkinter.CTkToplevel):
         self.resizable(False, False)
         self.columnconfigure(0, weight=1)  # configure grid system
 
+        gui = SETTINGS.snapshot_gui()
+
         self.title_label = customtkinter.CTkLabel(
-            self, text="Game Running", font=self.settings.get_gui("font_large")
+            self, text="Game Running", font=gui.font_large
         )
         self.title_label.grid(row=0, column=0, padx=20, pady=20)
 
         self.message_label = customtkinter.CTkLabel(
             self,
             text="Please wait until the Minecraft window opens",
-            font=self.settings.get_gui("font_normal")
+            font=gui.font_normal
         )
         self.message_label.grid(row=1, column=0, padx=20, pady=(0, 20))
 
+        self.deiconify()
         self.after(100, self.run)
 
         logger.debug("Created game window")
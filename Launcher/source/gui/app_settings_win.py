@@ -9,13 +9,30 @@ Classes:
 """
 
 import logging
+import threading
 import customtkinter
 from source import path, utils
+from source.mc.authentication import get_auth_handler
 from source.gui.popup_win import PopupWindow
-from source.mc.authentication import AuthenticationHandler
 
 logger = logging.getLogger(__name__)
 
+SETTINGS = utils.Settings()
+
+SLIDER_UPDATE_INTERVAL = 16  # Milliseconds between slider label updates, about one frame
+RAM_SLIDER_MIN = 1024  # MB
+RAM_SLIDER_MAX = 16384  # MB
+RAM_SLIDER_STEPS = 30
+# Label text for every value the slider can land on
+RAM_LABELS = {
+    value: f"RAM: {value} MB"
+    for value in range(
+        RAM_SLIDER_MIN,
+        RAM_SLIDER_MAX + 1,
+        (RAM_SLIDER_MAX - RAM_SLIDER_MIN) // RAM_SLIDER_STEPS
+    )
+}
+
 
 class ResetSettingsFrame(customtkinter.CTkFrame):
     """Frame for the reset settings."""
@@ -23,112 +40,112 @@ class ResetSettingsFrame(customtkinter.CTkFrame):
         super().__init__(master)
         logger.debug("Creating GUI settings frame")
 
-        self.settings = utils.Settings()
+        gui = SETTINGS.snapshot_gui()
 
         self.popup_window = None
+        self.reset_running = False
+        # Reset kind: (reset function, popup title, popup message)
+        self.reset_table = {
+            "gui": (
+                SETTINGS.reset_gui, "GUI Reset", "The GUI settings have been reset to default."
+            ),
+            "user": (
+                self.reset_user, "User Reset", "The User settings have been reset to default."
+            ),
+            "game": (
+                SETTINGS.reset_game, "Game Reset", "The Game settings have been reset to default."
+            ),
+            "all": (
+                SETTINGS.reset, "Settings Reset", "All settings have been reset to default."
+            ),
+        }
         self.grid_columnconfigure(0, weight=1)
 
         # Frame Title
         self.title_label = customtkinter.CTkLabel(
-            self, text="Resets", font=self.settings.get_gui("font_title")
+            self, text="Resets", font=gui.font_title
         )
         self.title_label.grid(row=0, column=0, padx=20, pady=(20, 10), sticky="n")
 
-        # Reset GUI Settings Button
-        self.reset_gui_settings_button = customtkinter.CTkButton(
-            self,
-            text="Reset GUI",
-            font=self.settings.get_gui("font_normal"),
-            command=self.reset_gui_settings
-        )
-        self.reset_gui_settings_button.grid(row=1, column=0, padx=20, pady=5, sticky="wse")
-
-        # Reset User Settings Button
-        self.reset_user_settings_button = customtkinter.CTkButton(
-            self,
-            text="Reset User",
-            font=self.settings.get_gui("font_normal"),
-            command=self.reset_user_settings
-        )
-        self.reset_user_settings_button.grid(row=2, column=0, padx=20, pady=5, sticky="wse")
-
-        # Reset Game Settings Button
-        self.reset_game_settings_button = customtkinter.CTkButton(
-            self,
-            text="Reset Game",
-            font=self.settings.get_gui("font_normal"),
-            command=self.reset_game_settings
-        )
-        self.reset_game_settings_button.grid(row=3, column=0, padx=20, pady=5, sticky="wse")
-
-        # Reset All Settings Button
-        self.reset_all_settings_button = customtkinter.CTkButton(
-            self,
-            text="Reset All",
-            font=self.settings.get_gui("font_normal"),
-            command=self.reset_all_settings
+        # Reset Buttons, one per reset kind
+        reset_buttons = (
+            ("Reset GUI", "gui"),
+            ("Reset User", "user"),
+            ("Reset Game", "game"),
+            ("Reset All", "all"),
         )
-        self.reset_all_settings_button.grid(row=4, column=0, padx=20, pady=(5, 20), sticky="wse")
+        button_style = {"font": gui.font_normal}  # Shared by every button in the frame
+        for row, (text, kind) in enumerate(reset_buttons, start=1):
+            pady = (5, 20) if row == len(reset_buttons) else 5  # Add padding to the last button
+            customtkinter.CTkButton(
+                self,
+                text=text,
+                command=lambda kind=kind: self.reset_settings(kind),
+                **button_style
+            ).grid(row=row, column=0, padx=20, pady=pady, sticky="wse")
 
         logger.debug("GUI settings frame created")
 
-    def reset_gui_settings(self):
-        """Reset the GUI settings to the default values."""
-        if self.popup_window is not None and self.popup_window.winfo_exists():
-            self.popup_window.lift()
-        else:
-            self.settings.reset_gui()
-            self.popup_window = PopupWindow(
-                master=self.master,
-                title="GUI Reset",
-                message="The GUI settings have been reset to default."
-            )
-            self.wait_window(self.popup_window)
-            self.popup_window = None
+    def reset_settings(self, kind: str):
+        """
+        Reset a group of settings to the default values.
 
-    def reset_user_settings(self):
-        """Reset the User settings to the default values."""
-        if self.popup_window is not None and self.popup_window.winfo_exists():
+        Parameters:
+        - kind (str): The settings to reset. One of 'gui', 'user', 'game', or 'all'.
+        """
+        if self.reset_running:
+            return
+        if self.popup_window is not None and self.popup_window.is_shown:
             self.popup_window.lift()
-        else:
-            auth_handler = AuthenticationHandler(self.settings.get_user("email"), path.CONTEXT)
-            auth_handler.remove_session()
-            self.settings.reset_user()
+            return
+
+        # The resets read and write files, the user reset also the authentication database,
+        # so they run off the Tk thread and the popup is shown once they finish
+        self.reset_running = True
+        threading.Thread(
+            target=self.run_reset, args=(kind,), name="reset-settings", daemon=True
+        ).start()
+
+    def run_reset(self, kind: str):
+        """
+        Run a reset and report it. This runs in a worker thread.
+
+        Parameters:
+        - kind (str): The settings to reset. One of 'gui', 'user', 'game', or 'all'.
+        """
+        reset, title, message = self.reset_table[kind]
+        try:
+            reset()
+        except Exception as reset_error:
+            logger.error("Error resetting %s settings: %s", kind, reset_error)
+            title, message = "Reset Error", "An error occurred while resetting the settings."
+        self.show_reset_popup(title, message)
+
+    @utils.run_in_main_thread
+    def show_reset_popup(self, title: str, message: str):
+        """
+        Show the result of a reset.
+
+        Parameters:
+        - title (str): The popup title.
+        - message (str): The popup message.
+        """
+        self.reset_running = False
+        if not self.winfo_exists():  # The settings window was closed during the reset
+            return
+        # The popup is created once and hidden when closed, it is destroyed with the window
+        if self.popup_window is None:
             self.popup_window = PopupWindow(
-                master=self.master,
-                title="User Reset",
-                message="The User settings have been reset to default."
+                master=self.master, title=title, message=message, reusable=True
             )
-            self.wait_window(self.popup_window)
-            self.popup_window = None
-
-    def reset_game_settings(self):
-        """Reset the Game settings to the default values."""
-        if self.popup_window is not None and self.popup_window.winfo_exists():
-            self.popup_window.lift()
         else:
-            self.settings.reset_game()
-            self.popup_window = PopupWindow(
-                master=self.master,
-                title="Game Reset",
-                message="The Game settings have been reset to default."
-            )
-            self.wait_window(self.popup_window)
-            self.popup_window = None
+            self.popup_window.show(title, message)
 
-    def reset_all_settings(self):
-        """Reset all settings to the default values."""
-        if self.popup_window is not None and self.popup_window.winfo_exists():
-            self.popup_window.lift()
-        else:
-            self.settings.reset()
-            self.popup_window = PopupWindow(
-                master=self.master,
-                title="Settings Reset",
-                message="All settings have been reset to default."
-            )
-            self.wait_window(self.popup_window)
-            self.popup_window = None
+    def reset_user(self):
+        """Remove the authentication session and reset the User settings."""
+        auth_handler = get_auth_handler(SETTINGS.get_user("email"))
+        auth_handler.remove_session()
+        SETTINGS.reset_user()
 
 
 class JVMArgsWindow(customtkinter.CTkToplevel):
@@ -136,64 +153,61 @@ class JVMArgsWindow(customtkinter.CTkToplevel):
     def __init__(self, master, **kwargs):
         super().__init__(master, **kwargs)
         logger.debug("Creating JVM Arguments window")
+        self.withdraw()  # Hidden until built so the window is drawn once
 
-        self.settings = utils.Settings()
+        gui = SETTINGS.snapshot_gui()
 
         self.title("JVM Arguments")
         self.geometry("600x300")
+        self.attributes("-topmost", True)
         self.grid_columnconfigure(0, weight=1)
         self.grid_rowconfigure(2, weight=1)
         self.grid_rowconfigure(4, weight=1)
 
-        self.attributes("-topmost", True)
-
-        initial_heap, max_heap = self.settings.get_game("ram_jvm_args")
-        # Get the number from the JVM Arguments
-        initial_heap = int(initial_heap.split("-Xms")[1].replace("M", ""))
-        max_heap = int(max_heap.split("-Xmx")[1].replace("M", ""))
-        if initial_heap == max_heap:
-            self.current_ram_allocation = initial_heap
-        else:
-            logger.warning("Initial and Max heap sizes are not equal. Using Max heap size.")
-            self.current_ram_allocation = max_heap
+        self.current_ram_allocation = SETTINGS.get_game("ram_allocation")
 
         # Ram Slider Label
         self.ram_slider_label = customtkinter.CTkLabel(
-            self, text="Memory Allocation", font=self.settings.get_gui("font_large")
+            self, text="Memory Allocation", font=gui.font_large
         )
         self.ram_slider_label.grid(row=0, column=0, padx=20, pady=(20, 0))
 
         # Ram Slider Value Label
         self.ram_value_var = customtkinter.IntVar(value=self.current_ram_allocation)
+        self.ram_text_var = customtkinter.StringVar(value=f"RAM: {self.current_ram_allocation} MB")
+        self.latest_ram_value = self.current_ram_allocation
+        self.pending_slider_update = None  # after() id of the scheduled label update
         self.ram_slider_value_label = customtkinter.CTkLabel(
             self,
-            text=f"RAM: {self.ram_value_var.get()} MB",
-            font=self.settings.get_gui("font_normal")
+            textvariable=self.ram_text_var,
+            font=gui.font_normal
         )
         self.ram_slider_value_label.grid(row=1, column=0, padx=20, pady=10, sticky="w")
 
         # Ram Slider
         self.ram_slider = customtkinter.CTkSlider(
             self,
-            from_=1024,
-            to=16384,
-            number_of_steps=30,
+            from_=RAM_SLIDER_MIN,
+            to=RAM_SLIDER_MAX,
+            number_of_steps=RAM_SLIDER_STEPS,
             variable=self.ram_value_var,
             command=self.slider_event
         )
         self.ram_slider.grid(row=2, column=0, padx=20, pady=(0, 20), sticky="we")
+        # Show the final value as soon as the slider is released
+        self.ram_slider.bind("<ButtonRelease-1>", lambda _: self.flush_slider())
 
         # JVM Arguments Label
         self.jvm_args_label = customtkinter.CTkLabel(
-            self, text="Additional JVM Arguments", font=self.settings.get_gui("font_large")
+            self, text="Additional JVM Arguments", font=gui.font_large
         )
         self.jvm_args_label.grid(row=3, column=0, padx=20, pady=(0, 10))
 
         # JVM Arguments Entry
         self.jvm_args_entry = customtkinter.CTkEntry(
-            self, font=self.settings.get_gui("font_normal"), width=300
+            self, font=gui.font_normal, width=300
         )
-        self.jvm_args_entry.insert(0, " ".join(self.settings.get_game("additional_jvm_args")))
+        self.jvm_args_entry.insert(0, SETTINGS.get_game("additional_jvm_args"))
         self.jvm_args_entry.grid(row=4, column=0, padx=20, pady=(0, 20), sticky="we")
 
         # Save Button
@@ -202,24 +216,52 @@ class JVMArgsWindow(customtkinter.CTkToplevel):
             text="Save",
             width=160,
             height=32,
-            font=self.settings.get_gui("font_large"),
+            font=gui.font_large,
             command=self.save_jvm_args
         )
         self.save_button.grid(row=5, column=0, padx=20, pady=(0, 20), sticky="s")
 
+        self.deiconify()
+
         logger.debug("JVM Arguments window created")
 
     def slider_event(self, value):
-        """Update the value label when the slider is moved."""
-        self.ram_value_var.set(int(value))
-        self.ram_slider_value_label.configure(text=f"RAM: {self.ram_value_var.get()} MB")
+        """
+        Update the value label when the slider is moved.
+        Label updates are limited to about one per frame while dragging.
+        """
+        value = round(value)  # The slider reports floats that can land just below a step
+        if value == self.latest_ram_value:  # Still on the same step, nothing to update
+            return
+        self.latest_ram_value = value
+        if self.pending_slider_update is None:
+            self.pending_slider_update = self.after(SLIDER_UPDATE_INTERVAL, self.flush_slider)
+
+    def flush_slider(self):
+        """Apply the latest slider value to the value label."""
+        if self.pending_slider_update is not None:
+            self.after_cancel(self.pending_slider_update)
+            self.pending_slider_update = None
+        value = self.latest_ram_value
+        self.ram_value_var.set(value)
+        # A saved value off the slider steps is not in the table
+        self.ram_text_var.set(RAM_LABELS.get(value) or f"RAM: {value} MB")
+
+    def destroy(self):
+        """Destroy the window. This overrides the default destroy method to cancel updates."""
+        if self.pending_slider_update is not None:
+            self.after_cancel(self.pending_slider_update)
+            self.pending_slider_update = None
+        super().destroy()
 
     def save_jvm_args(self):
         """Save the JVM Arguments to the settings."""
-        ram_jvm_args = [f"-Xms{self.ram_value_var.get()}M", f"-Xmx{self.ram_value_var.get()}M"]
-        additional_jvm_args = self.jvm_args_entry.get().split()
-        additional_jvm_args = list(filter(None, additional_jvm_args))  # filter out empty strings
-        self.settings.set_game(ram_jvm_args=ram_jvm_args, additional_jvm_args=additional_jvm_args)
+        self.flush_slider()
+        # Stored as typed, the arguments are split when the game is launched
+        additional_jvm_args = self.jvm_args_entry.get().strip()
+        SETTINGS.set_game(
+            ram_allocation=self.ram_value_var.get(), additional_jvm_args=additional_jvm_args
+        )
         self.destroy()
 
 
@@ -229,7 +271,7 @@ class GameSettingsFrame(customtkinter.CTkFrame):
         super().__init__(master)
         logger.debug("Creating game settings frame")
 
-        self.settings = utils.Settings()
+        gui = SETTINGS.snapshot_gui()
 
         self.grid_columnconfigure(0, weight=1)
 
@@ -237,16 +279,17 @@ class GameSettingsFrame(customtkinter.CTkFrame):
 
         # Frame Title
         self.title_label = customtkinter.CTkLabel(
-            self, text="Game", font=self.settings.get_gui("font_title")
+            self, text="Game", font=gui.font_title
         )
         self.title_label.grid(row=0, column=0, padx=20, pady=(20, 10), sticky="n")
 
         # Open MC Data Folder
+        button_style = {"font": gui.font_normal}  # Shared by every button in the frame
         self.open_data_folder_button = customtkinter.CTkButton(
             self,
             text="Open Game Folder",
-            font=self.settings.get_gui("font_normal"),
             command=self.open_data_folder,
+            **button_style
         )
         self.open_data_folder_button.grid(row=1, column=0, padx=20, pady=5, sticky="wse")
 
@@ -254,8 +297,8 @@ class GameSettingsFrame(customtkinter.CTkFrame):
         self.jvm_args_button = customtkinter.CTkButton(
             self,
             text="Memory & Arguments",
-            font=self.settings.get_gui("font_normal"),
-            command=self.open_jvm_args_window
+            command=self.open_jvm_args_window,
+            **button_style
         )
         self.jvm_args_button.grid(row=2, column=0, padx=20, pady=(5, 20), sticky="wse")
 
@@ -267,7 +310,7 @@ class GameSettingsFrame(customtkinter.CTkFrame):
 
     def open_jvm_args_window(self):
         """Open the JVM Arguments dialog."""
-        if self.jvm_args_window is not None and self.jvm_args_window.winfo_exists():
+        if self.jvm_args_window is not None:
             self.jvm_args_window.lift()
         else:
             self.jvm_args_window = JVMArgsWindow(self.master)
@@ -281,8 +324,9 @@ class SettingsWindow(customtkinter.CTkToplevel):
     def __init__(self, master, **kwargs):
         super().__init__(master, **kwargs)
         logger.debug("Creating settings window")
+        self.withdraw()  # Hidden until built so the window is drawn once
 
-        self.settings = utils.Settings()
+        gui = SETTINGS.snapshot_gui()
 
         self.title("Settings")
         self.geometry("500x350")
@@ -304,11 +348,14 @@ class SettingsWindow(customtkinter.CTkToplevel):
         self.open_settings_file_button = customtkinter.CTkButton(
             self,
             text="Open Launcher Settings",
-            font=self.settings.get_gui("font_normal"),
-            command=lambda: utils.open_path(self.settings.path)
+            font=gui.font_normal,
+            command=lambda: utils.open_path(SETTINGS.path)
         )
         self.open_settings_file_button.grid(
             row=1, column=0, columnspan=2, padx=20, pady=0, sticky="wne"
         )
 
+        self.update_idletasks()  # Lay out all the widgets in a single pass
+        self.deiconify()
+
         logger.debug("Settings window created")
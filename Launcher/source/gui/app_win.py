@@ -9,18 +9,19 @@ classes:
 - CenterFrame: Frame for the bulletin and title.
 """
 
-from time import sleep
+import collections
+import concurrent.futures
 import logging
 import os
+import threading
 import importlib.util
 import customtkinter
 from source import path, utils
-from source.mc.minecraft import MCManager
-from source.mc.authentication import AuthenticationHandler
+from source.mc.minecraft import MCManager, get_mc
+from source.mc.authentication import get_auth_handler
 from source.gui.login_win import LoginWindow
+from source.gui.popup_win import PopupWindow
 from source.gui.app_settings_win import SettingsWindow
-from source.gui.app_install_win import InstallWindow
-from source.gui.app_run_win import RunWindow
 
 if '_PYIBoot_SPLASH' in os.environ and importlib.util.find_spec("pyi_splash"):
     try:
@@ -33,6 +34,8 @@ else:
 
 logger = logging.getLogger(__name__)
 
+SETTINGS = utils.Settings()
+
 
 class LeftFrame(customtkinter.CTkFrame):
     """Frame for launcher info, theme dropdown, and settings button"""
@@ -40,7 +43,7 @@ class LeftFrame(customtkinter.CTkFrame):
         super().__init__(master)
         logger.debug("Creating left frame")
 
-        self.settings = utils.Settings()
+        gui = SETTINGS.snapshot_gui()
         self.master = master
 
         self.settings_window = None
@@ -49,38 +52,36 @@ class LeftFrame(customtkinter.CTkFrame):
 
         # Title
         self.title_label = customtkinter.CTkLabel(
-            self, text=path.PROGRAM_NAME_LONG, font=self.settings.get_gui("font_title")
+            self, text=path.PROGRAM_NAME_LONG, font=gui.font_title
         )
         self.title_label.grid(row=0, column=0, padx=20, pady=(20, 0), sticky="n")
 
         # Version
         self.version_label = customtkinter.CTkLabel(
-            self, text=f"v{path.VERSION}", font=self.settings.get_gui("font_small")
+            self, text=f"v{path.VERSION}", font=gui.font_small
         )
         self.version_label.grid(row=1, column=0, padx=24, pady=0, sticky="sw")
 
         # Theme Drop Down
         self.theme_menu_var = customtkinter.StringVar(
-            value=self.settings.get_gui("appearance").title()
+            value=gui.appearance.title()
         )
         self.theme_menu = customtkinter.CTkOptionMenu(
             self,
             values=["System", "Dark", "Light"],
-            font=self.settings.get_gui("font_normal"),
+            font=gui.font_normal,
             command=self.theme_menu_callback,
             variable=self.theme_menu_var
         )
         self.theme_menu.grid(row=2, column=0, padx=20, pady=(0, 20), sticky="s")
 
         # Settings Button
-        self.settings_button_photo = customtkinter.CTkImage(
-            utils.get_image("settings.png").resize(self.settings.get_gui("image_normal"))
-        )
+        self.settings_button_photo = utils.get_ctk_image("settings.png", gui.image_normal)
         self.settings_button = customtkinter.CTkButton(
             self,
             image=self.settings_button_photo,
             text="Settings",
-            font=self.settings.get_gui("font_normal"),
+            font=gui.font_normal,
             command=self.open_settings
         )
         self.settings_button.grid(row=3, column=0, padx=20, pady=(0, 20), sticky="s")
@@ -98,13 +99,13 @@ class LeftFrame(customtkinter.CTkFrame):
         - None
         """
         new_theme = theme.casefold()
-        self.settings.set_gui(appearance=new_theme)
+        SETTINGS.set_gui(appearance=new_theme)
         customtkinter.set_appearance_mode(new_theme)
 
     def open_settings(self):
         """Opens the settings window."""
-        # check if settings window already exists
-        if self.settings_window is not None and self.settings_window.winfo_exists():
+        # Cleared once wait_window returns, so it is only set while the window is open
+        if self.settings_window is not None:
             # If the settings window exists and is open, bring it to the front
             self.settings_window.lift()
         else:
@@ -114,31 +115,33 @@ class LeftFrame(customtkinter.CTkFrame):
             self.wait_window(self.settings_window)
             self.settings_window = None  # Reset the attribute when the window is closed
 
-            # Reinitialize the frames to apply the changes
+            # Pick up any changes made to the settings file, then
+            # reinitialize the frames to apply the changes
+            SETTINGS.reload()
             self.master.initialize_frames()
 
 
 class RightFrame(customtkinter.CTkFrame):
     """Frame for the user dropdown, auto-join switch, and play button."""
-    def __init__(self, master, mcmanager: MCManager):
+    def __init__(self, master, mcmanager: MCManager=None):
         super().__init__(master)
         logger.debug("Creating right frame")
 
         self.master = master
-        self.settings = utils.Settings()
+        gui = SETTINGS.snapshot_gui()
 
         self.login_window = None
         self.grid_columnconfigure(0, weight=1)
         self.grid_rowconfigure(0, weight=1)
 
         # User Dropdown
-        if self.settings.get_user("email"):
-            self.auth_handler = AuthenticationHandler(
-                email=self.settings.get_user("email"), context=path.CONTEXT
-            )
+        if SETTINGS.get_user("email"):
+            self.auth_handler = get_auth_handler(SETTINGS.get_user("email"))
             username = self.auth_handler.get_username()
             if username:
-                altnames: dict | None = mcmanager.remote_config.get("altnames", {})
+                altnames: dict | None = {}
+                if mcmanager is not None:
+                    altnames = mcmanager.remote_config.get("altnames", {})
                 if not altnames:
                     altnames = {}
                 if username in altnames:
@@ -153,7 +156,7 @@ class RightFrame(customtkinter.CTkFrame):
             user_menu_values = ["Login"]
         self.user_menu = customtkinter.CTkOptionMenu(
             self,
-            font=self.settings.get_gui("font_normal"),
+            font=gui.font_normal,
             values=user_menu_values,
             command=self.user_menu_callback,
             variable=self.user_menu_var
@@ -162,12 +165,12 @@ class RightFrame(customtkinter.CTkFrame):
 
         # Auto-Join Switch
         self.autojoin_switch_var = customtkinter.BooleanVar(
-            value=self.settings.get_game("autojoin")
+            value=SETTINGS.get_game("autojoin")
         )
         self.autojoin_switch = customtkinter.CTkSwitch(
             self,
             text="Auto-Join",
-            font=self.settings.get_gui("font_normal"),
+            font=gui.font_normal,
             command=self.auto_join_callback,
             variable=self.autojoin_switch_var,
             onvalue=True,
@@ -175,16 +178,15 @@ class RightFrame(customtkinter.CTkFrame):
         )
         self.autojoin_switch.grid(row=1, column=0, padx=20, pady=0, sticky="s")
 
-        self.play_button_photo = customtkinter.CTkImage(
-            utils.get_image("rocket.png").resize(self.settings.get_gui("image_large"))
-        )
+        self.play_button_photo = utils.get_ctk_image("rocket.png", gui.image_large)
         self.play_button = customtkinter.CTkButton(
             self,
             image=self.play_button_photo,
             text="Play",
-            font=self.settings.get_gui("font_title"),
+            font=gui.font_title,
             fg_color="green",
-            command=self.run_game
+            command=self.run_game,
+            state="normal" if mcmanager else "disabled"  # Enabled once the remote config is loaded
         )
         self.play_button.grid(row=2, column=0, padx=20, pady=20, sticky="s")
 
@@ -192,13 +194,8 @@ class RightFrame(customtkinter.CTkFrame):
 
     def auto_join_callback(self):
         """Callback function for the auto-join switch."""
-        action = self.autojoin_switch_var.get()
-        if action is True:
-            self.autojoin_switch_var.set(True)
-            self.settings.set_game(autojoin=True)
-        elif action is False:
-            self.autojoin_switch_var.set(False)
-            self.settings.set_game(autojoin=False)
+        # The switch already updated the variable, only the setting needs saving
+        SETTINGS.set_game(autojoin=self.autojoin_switch_var.get())
 
     def user_menu_callback(self, action: str):
         """
@@ -210,21 +207,21 @@ class RightFrame(customtkinter.CTkFrame):
         action = action.casefold()
         logger.debug("User menu callback action: %s", action)
         if action == "logout":
-            auth_handler = AuthenticationHandler(self.settings.get_user("email"), path.CONTEXT)
+            auth_handler = get_auth_handler(SETTINGS.get_user("email"))
             auth_handler.remove_session()
             self.user_menu_var.set("Logged Out")
             self.user_menu.configure(values=["Login"])
             self.user_menu_var.set("Login")
             logger.debug("Logout complete")
         if action == "login":
-            if self.login_window is not None and self.login_window.winfo_exists():
+            if self.login_window is not None:
                 self.login_window.lift()
                 logger.debug("Login window already exists")
             else:
                 self.login_window = LoginWindow(master=self)
                 self.login_window.transient(self)
                 self.wait_window(self.login_window)
-                auth_handler = AuthenticationHandler(self.settings.get_user("email"), path.CONTEXT)
+                auth_handler = get_auth_handler(SETTINGS.get_user("email"))
                 username = auth_handler.get_username()
                 if username:
                     self.user_menu_var.set(username)
@@ -237,6 +234,12 @@ class RightFrame(customtkinter.CTkFrame):
 
     def run_game(self):
         """Start installation and run minecraft."""
+        # Only needed once Play is pressed, so imported on first use
+        # pylint: disable=import-outside-toplevel
+        from source.gui.app_install_win import InstallWindow
+        from source.gui.app_run_win import RunWindow
+        # pylint: enable=import-outside-toplevel
+
         self.play_button.configure(state="disabled")
         self.master.left_frame.settings_button.configure(state="disabled")
 
@@ -262,62 +265,85 @@ class RightFrame(customtkinter.CTkFrame):
 
 class ScrollableFrame(customtkinter.CTkScrollableFrame):
     """Frame for the bulletin."""
-    def __init__(self, master, mcmanager: MCManager):
+    def __init__(self, master, mcmanager: MCManager=None):
         super().__init__(master)
         logger.debug("Creating scrollable frame")
 
-        self.settings = utils.Settings()
+        gui = SETTINGS.snapshot_gui()
+        self.font_title = gui.font_title
+        self.font_normal = gui.font_normal
+        self.pending_sections = collections.deque()
+        self.pending_section_build = None  # after_idle() id of the next section build
 
         # Parse the bulletin config and create the bulletin
-        bulletin_config: dict = mcmanager.remote_config.get("bulletin", None)
+        bulletin_config: dict = mcmanager.remote_config.get("bulletin", None) if mcmanager else None
         if not bulletin_config:
             self.columnconfigure(0, weight=1)
             self.rowconfigure(0, weight=1)
-            # Create a frame that will center the label
+            # Create a frame that will center the label, it expands to fill the ScrollableFrame
             centering_frame = customtkinter.CTkFrame(self)
             centering_frame.grid(row=0, column=0, sticky="nsew", padx=10, pady=10)
-            self.grid_columnconfigure(0, weight=1)
-            self.grid_rowconfigure(0, weight=1)
-            # Now, centering_frame will expand to fill the ScrollableFrame
 
             # Place the no_bulletin_label in the centering_frame
             no_bulletin_label = customtkinter.CTkLabel(
                 centering_frame,
-                text="No Bulletin Available",
-                font=self.settings.get_gui("font_large")
+                text="No Bulletin Available" if mcmanager else "Loading Bulletin",
+                font=gui.font_large
             )
             no_bulletin_label.place(relx=0.5, rely=0.5, anchor="center")
             return
 
-        for column in bulletin_config.keys():
+        for column, sections in bulletin_config.items():
             column_number = int(column.split("_")[1])
             self.columnconfigure(
                 column_number, weight=1, uniform="column_group"  # Change size together
             )
-            # Below this line is management within the frames themselves
-            section_row = 0
-            for section, items in bulletin_config[column].items():
-                section_frame = customtkinter.CTkFrame(self)
-                section_frame.grid(
-                    row=section_row, column=column_number, padx=10, pady=10, sticky="nsew"
-                )
-                section_frame.grid_columnconfigure(0, weight=1)
-                section_label = customtkinter.CTkLabel(
-                    section_frame, text=section, font=self.settings.get_gui("font_title")
-                )
-                section_label.grid(row=section_row, column=0, padx=10, pady=10, sticky="n")
-                section_row += 1
-                item_row = section_row
-                for i, item in enumerate(items):
-                    pady = (10, 0) if i < len(items) - 1 else 10  # Add padding to the last item
-                    item_label = utils.WrappingLabel(
-                        section_frame, text=item, font=self.settings.get_gui("font_normal")
-                    )
-                    item_label.grid(row=item_row, column=0, padx=10, pady=pady, sticky="we")
-                    item_row += 1
+            for section_row, (section, items) in enumerate(sections.items()):
+                self.pending_sections.append((column_number, section_row, section, items))
+
+        # The first section is built now, the rest while the event loop is idle,
+        # so a large bulletin does not hold up the window
+        self.build_next_section()
 
         logger.debug("Scrollable frame created")
 
+    def build_next_section(self):
+        """Build the next bulletin section and schedule the one after it."""
+        self.pending_section_build = None
+        if not self.pending_sections:
+            logger.debug("Bulletin built")
+            return
+
+        # Below this is management within the frames themselves
+        column_number, section_row, section, items = self.pending_sections.popleft()
+        section_frame = customtkinter.CTkFrame(self)
+        section_frame.grid_columnconfigure(0, weight=1)
+        section_label = customtkinter.CTkLabel(
+            section_frame, text=section, font=self.font_title
+        )
+        section_label.grid(row=section_row, column=0, padx=10, pady=10, sticky="n")
+        item_row = section_row + 1
+        for i, item in enumerate(items):
+            pady = (10, 0) if i < len(items) - 1 else 10  # Add padding to the last item
+            item_label = utils.WrappingLabel(
+                section_frame, text=item, font=self.font_normal
+            )
+            item_label.grid(row=item_row, column=0, padx=10, pady=pady, sticky="we")
+            item_row += 1
+        # Placed once its contents are gridded, so the bulletin is laid out once per section
+        section_frame.grid(
+            row=section_row, column=column_number, padx=10, pady=10, sticky="nsew"
+        )
+
+        self.pending_section_build = self.after_idle(self.build_next_section)
+
+    def destroy(self):
+        """Destroy the frame. This overrides the default destroy method to stop building."""
+        if self.pending_section_build is not None:
+            self.after_cancel(self.pending_section_build)
+            self.pending_section_build = None
+        super().destroy()
+
 
 class CenterFrame(customtkinter.CTkFrame):
     """Frame for the bulletin and title."""
@@ -325,17 +351,14 @@ class CenterFrame(customtkinter.CTkFrame):
         super().__init__(master)
         logger.debug("Creating center frame")
 
-        self.settings = utils.Settings()
-
-        if mcmanager is None:
-            raise ValueError("MCManager object is required")
+        gui = SETTINGS.snapshot_gui()
 
         self.grid_columnconfigure(0, weight=1)
         self.grid_rowconfigure(1, weight=2)
 
         # Title Label
         self.title_label = customtkinter.CTkLabel(
-            self, text="Server Bulletin", font=self.settings.get_gui("font_title")
+            self, text="Server Bulletin", font=gui.font_title
         )
         self.title_label.grid(row=0, column=0, padx=20, pady=(20, 0), sticky="n")
 
@@ -355,22 +378,21 @@ class App(customtkinter.CTk):
         if SPLASH_FOUND:
             pyi_splash.update_text("Loading Prerequisites")
             logger.debug("Updated splash text")
-            sleep(1)
         else:
             logger.warning("Splash screen not found")
 
         logger.debug("Creating main window")
 
-        self.settings = utils.Settings()
-        self.mc = MCManager(context=path.CONTEXT)
+        gui = SETTINGS.snapshot_gui()
+        self.mc = None  # Set once the remote config is loaded
 
         self.left_frame = None
         self.right_frame = None
         self.center_frame = None
 
         self.title(path.PROGRAM_NAME)
-        geom_length, geom_height = self.settings.get_gui("main_window_geometry")
-        min_length, min_height = self.settings.get_gui("main_window_min_size")
+        geom_length, geom_height = gui.main_window_geometry
+        min_length, min_height = gui.main_window_min_size
         self.geometry(f"{geom_length}x{geom_height}")
         self.minsize(min_length, min_height)
         self.grid_rowconfigure(0, weight=1)  # configure grid system
@@ -381,9 +403,14 @@ class App(customtkinter.CTk):
         if SPLASH_FOUND:
             pyi_splash.update_text("Loading Frames")
             logger.debug("Updated splash text")
-            sleep(.25)
 
         self.initialize_frames()
+        # Fetching the remote config waits on the network, the frames are rebuilt once it arrives.
+        # The future is polled from the Tk thread, Tk can't be called from the worker before
+        # the main loop is running.
+        self.load_future = concurrent.futures.Future()
+        threading.Thread(target=self.load_mc, name="load-mc", daemon=True).start()
+        self.after(50, self.poll_load_mc)
 
         logger.debug("Main window created")
 
@@ -393,15 +420,59 @@ class App(customtkinter.CTk):
         # pylint: disable=W0012
         # pylint: enable=E0606
 
+    def load_mc(self):
+        """
+        Create the shared MCManager and pass it to load_future.
+        This runs in a daemon thread, so closing the launcher doesn't wait on the network.
+        """
+        try:
+            self.load_future.set_result(get_mc())
+        except Exception as mc_error:
+            self.load_future.set_exception(mc_error)
+
+    def poll_load_mc(self):
+        """Check on the MCManager worker without blocking the event loop."""
+        if not self.load_future.done():
+            self.after(50, self.poll_load_mc)
+            return
+
+        try:
+            mc = self.load_future.result()
+        except Exception as mc_error:
+            logger.error("Error loading the remote config: %s", mc_error)
+            mc = None
+        self.finish_load_mc(mc)
+
+    def finish_load_mc(self, mc: MCManager):
+        """
+        Rebuild the frames with the loaded MCManager.
+
+        Parameters:
+        - mc (MCManager): The shared MCManager, None if it could not be created.
+        """
+        if mc is None:
+            remote_popup_window = PopupWindow(
+                self,
+                title="Connection Error",
+                message="The server information could not be loaded. Please try again later.",
+            )
+            remote_popup_window.wait_window()
+            self.destroy()
+            return
+        self.mc = mc
+        self.initialize_frames()
+
     def initialize_frames(self):
         """Initialize the frames."""
-        customtkinter.set_appearance_mode(self.settings.get_gui("appearance"))
         if self.left_frame is not None:
             self.left_frame.destroy()
         if self.right_frame is not None:
             self.right_frame.destroy()
         if self.center_frame is not None:
             self.center_frame.destroy()
+        # Set after the old frames are gone so they are not restyled, and before the new ones
+        # are built so they are created in the right mode instead of being redrawn
+        customtkinter.set_appearance_mode(SETTINGS.get_gui("appearance"))
 
         self.left_frame = LeftFrame(self)
         self.right_frame = RightFrame(self, mcmanager=self.mc)
@@ -8,18 +8,20 @@ Classes:
 import logging
 import threading
 import customtkinter
-from source import path, utils
-from source.mc.authentication import AuthenticationHandler
+from source import utils
+from source.mc.authentication import get_auth_handler
 
 logger = logging.getLogger(__name__)
 
+SETTINGS = utils.Settings()
+
 class AuthWindow(customtkinter.CTkToplevel):
     """Window for authenticating the user."""
     def __init__(self, master, email, **kwargs):
         super().__init__(master, **kwargs)
         logger.debug("Creating authentication window")
 
-        self.settings = utils.Settings()
+        gui = SETTINGS.snapshot_gui()
 
         self.title("Authentication")
         self.email = email
@@ -34,7 +36,7 @@ class AuthWindow(customtkinter.CTkToplevel):
         self.protocol("WM_DELETE_WINDOW", self.destroy)  # Handle the close event
 
         self.label = customtkinter.CTkLabel(
-            self, text=f"Logging into {self.email}", font=self.settings.get_gui("font_large")
+            self, text=f"Logging into {self.email}", font=gui.font_large
         )
         self.label.grid(row=0, column=0, pady=(20, 0))
 
@@ -42,21 +44,24 @@ class AuthWindow(customtkinter.CTkToplevel):
         self.progress.grid(row=1, column=0, pady=(20, 0))
         self.progress.start()
 
-        auth_thread = threading.Thread(target=self.auth, daemon=True)
-        auth_thread.start()
+        # The thread closes the window when it finishes, nothing has to watch it
+        self.auth_thread = threading.Thread(target=self.auth, daemon=True)
+        self.auth_thread.start()
 
         logger.debug("Authentication window created")
 
-        while auth_thread.is_alive():
-            self.update_idletasks()
-            self.update()
+    def auth(self):
+        """Runs the authentication process. This runs in a worker thread."""
+        try:
+            auth_handler = get_auth_handler(SETTINGS.get_user("email"))
+            auth_handler.authenticate()
+        finally:
+            self.finish_auth()
 
+    @utils.run_in_main_thread
+    def finish_auth(self):
+        """Close the window once authentication has finished."""
+        if not self.winfo_exists():  # Closed by the user
+            return
         self.destroy()
         logger.debug("Authentication window destroyed")
-
-    def auth(self):
-        """Runs the authentication process."""
-        auth_handler = AuthenticationHandler(
-            email=self.settings.get_user("email"), context=path.CONTEXT
-        )
-        auth_handler.authenticate()
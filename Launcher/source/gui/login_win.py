@@ -7,20 +7,23 @@ Classes:
 
 import logging
 import customtkinter
-from source import path, utils
-from source.mc.authentication import AuthenticationHandler
+from source import utils
+from source.mc.authentication import get_auth_handler
 from source.gui.auth_win import AuthWindow
 
 logger = logging.getLogger(__name__)
 
+SETTINGS = utils.Settings()
+
 
 class LoginWindow(customtkinter.CTkToplevel):
     """Window for entering login information."""
     def __init__(self, master, **kwargs):
         super().__init__(master, **kwargs)
         logger.debug("Creating login window")
+        self.withdraw()  # Hidden until built so the window is drawn once
 
-        self.settings = utils.Settings()
+        gui = SETTINGS.snapshot_gui()
 
         self.title("Login")
         self.geometry("450x150")
@@ -35,12 +38,12 @@ class LoginWindow(customtkinter.CTkToplevel):
         self.entry = customtkinter.CTkEntry(
             self,
             width=300,
-            font=self.settings.get_gui("font_normal"),
+            font=gui.font_normal,
             placeholder_text="Microsoft Email Address",
             justify="center",
         )
         self.entry.grid(row=1, column=1, pady=(20, 10), sticky="nsew")
-        self.bind("<Return>", lambda _: self.login())
+        self.entry.bind("<Return>", lambda _: self.login())
 
         # button centered
         self.button = customtkinter.CTkButton(
@@ -48,10 +51,12 @@ class LoginWindow(customtkinter.CTkToplevel):
             width=150,
             text="Login",
             command=self.login,
-            font=self.settings.get_gui("font_normal")
+            font=gui.font_normal
         )
         self.button.grid(row=2, column=1, pady=(10, 20))
 
+        self.deiconify()
+
         logger.debug("Login window created")
 
     def login(self):
@@ -62,12 +67,12 @@ class LoginWindow(customtkinter.CTkToplevel):
         to initiate the authentication process. Destroys the current login window.
         """
         self.button.configure(state="disabled")
-        self.settings.set_user(email=self.entry.get())
-        auth_handler = AuthenticationHandler(
-            email=self.settings.get_user("email"), context=path.CONTEXT
-        )
+        SETTINGS.set_user(email=self.entry.get())
+        auth_handler = get_auth_handler(SETTINGS.get_user("email"))
         self.auth_window = AuthWindow(master=self.master, email=self.entry.get())
-        if not auth_handler.get_session():  # if the session failed, re-enable the button
+        self.wait_window(self.auth_window)  # Tk keeps handling events until authentication ends
+        # The username is only set with a valid session, it is then cached for the main window
+        if not auth_handler.get_username():  # if the session failed, re-enable the button
             logger.error("Login session could not be established, releasing button")
             self.button.configure(state="normal")
         else:
@@ -2,6 +2,7 @@
 Contains the PopupWindow class
 
 Classes:
+- PopupBodyMixin: Builds the contents shared by the popup windows
 - PopupWindow: Popup window
 - StandalonePopupWindow: Standalone popup window
 """
@@ -12,21 +13,23 @@ from source import utils
 
 logger = logging.getLogger(__name__)
 
+SETTINGS = utils.Settings()
 
-class PopupWindow(customtkinter.CTkToplevel):
-    """Popup window for displaying messages."""
-    def __init__(self, master, title, message, **kwargs):
-        super().__init__(master, **kwargs)
-        logger.debug("Creating popup window")
 
-        self.settings = utils.Settings()
+class PopupBodyMixin:
+    """Builds the contents shared by the popup windows."""
+    def build_popup(self, title, message, close):
+        """
+        Configure the window and create the message and OK button.
 
-        logger.debug("Popup window title: %s", title)
-        logger.debug("Popup window message: %s", message)
+        Parameters:
+        - title (str): The window title.
+        - message (str): The message to display.
+        - close (callable): Called when the OK button is pressed.
+        """
+        gui = SETTINGS.snapshot_gui()
 
         self.title(title)
-        self.attributes("-topmost", True)
-        self.transient(master)
         self.geometry("500x200")
         self.resizable(False, False)
         self.grid_columnconfigure(0, weight=1)
@@ -39,49 +42,74 @@ class PopupWindow(customtkinter.CTkToplevel):
         self.label = customtkinter.CTkLabel(
             self.message_frame,
             text=message,
-            font=self.settings.get_gui("font_large"), wraplength=400
+            font=gui.font_large, wraplength=400
         )
         self.label.grid(row=0, column=0, padx=20, pady=20)
 
         self.button = customtkinter.CTkButton(
-            self, text="OK", command=self.destroy, font=self.settings.get_gui("font_normal")
+            self, text="OK", command=close, font=gui.font_normal
         )
         self.button.grid(row=1, column=0, padx=20, pady=(0, 20), sticky="s")
 
-        logger.debug("Popup window created")
 
+class PopupWindow(PopupBodyMixin, customtkinter.CTkToplevel):
+    """
+    Popup window for displaying messages.
 
-class StandalonePopupWindow(customtkinter.CTk):
-    """Standalone popup window for displaying messages."""
-    def __init__(self, title, message, **kwargs):
-        super().__init__(**kwargs)
-        logger.debug("Creating standalone popup window")
+    A reusable popup is hidden instead of destroyed when closed,
+    and can be shown again with a new title and message.
+    """
+    def __init__(self, master, title, message, reusable=False, **kwargs):
+        super().__init__(master, **kwargs)
+        logger.debug("Creating popup window")
+        self.withdraw()  # Hidden until built so the window is drawn once
+
+        self.is_shown = True
+        close = self.hide if reusable else self.destroy
+        self.protocol("WM_DELETE_WINDOW", close)
+
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Popup window title: %s, message: %s", title, message)
+
+        self.attributes("-topmost", True)
+        self.transient(master)
+        self.build_popup(title, message, close)
+
+        self.deiconify()
 
-        self.settings = utils.Settings()
+        logger.debug("Popup window created")
 
-        logger.debug("Standalone Popup window title: %s", title)
-        logger.debug("Standalone Popup window message: %s", message)
+    def show(self, title, message):
+        """
+        Show the popup again with a new title and message.
 
+        Parameters:
+        - title (str): The window title.
+        - message (str): The message to display.
+        """
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Popup window title: %s, message: %s", title, message)
         self.title(title)
-        self.geometry("500x200")
-        self.resizable(False, False)
-        self.grid_columnconfigure(0, weight=1)
-        self.grid_rowconfigure(0, weight=1)
+        self.label.configure(text=message)
+        self.deiconify()
+        self.lift()
+        self.is_shown = True
 
-        # Scrollable frame
-        self.message_frame = customtkinter.CTkScrollableFrame(self)
-        self.message_frame.grid(row=0, column=0, padx=20, pady=20, sticky="new")
+    def hide(self):
+        """Hide the popup so it can be shown again later."""
+        self.withdraw()
+        self.is_shown = False
 
-        self.label = customtkinter.CTkLabel(
-            self.message_frame,
-            text=message,
-            font=self.settings.get_gui("font_large"), wraplength=400
-        )
-        self.label.grid(row=0, column=0, padx=20, pady=20)
 
-        self.button = customtkinter.CTkButton(
-            self, text="OK", command=self.destroy, font=self.settings.get_gui("font_normal")
-        )
-        self.button.grid(row=1, column=0, padx=20, pady=(0, 20), sticky="s")
+class StandalonePopupWindow(PopupBodyMixin, customtkinter.CTk):
+    """Standalone popup window for displaying messages."""
+    def __init__(self, title, message, **kwargs):
+        super().__init__(**kwargs)
+        logger.debug("Creating standalone popup window")
+
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Standalone Popup window title: %s, message: %s", title, message)
+
+        self.build_popup(title, message, self.destroy)
 
         logger.debug("Standalone popup window created")
@@ -4,6 +4,9 @@ A module used to authenticate a user with Microsoft's services.
 Classes:
 - AuthenticationHandler: Class used to manage authentication with Microsoft's services.
 
+Functions:
+- get_auth_handler: Get the shared AuthenticationHandler for an email.
+
 Constants:
 - AUTH_DATABASE_FILE_NAME (str): The name of the authentication database file.
 - CLIENT_ID (str): The client ID.
@@ -14,6 +17,7 @@ Constants:
 - NONCE (str): The nonce.
 """
 
+import functools
 import logging
 import threading
 from queue import Queue
@@ -29,6 +33,8 @@ from source import utils, path
 
 logger = logging.getLogger(__name__)
 
+SETTINGS = utils.Settings()
+
 AUTH_DATABASE_FILE_NAME = "hominum_auth.json"  # Authentication database file name
 CLIENT_ID = "2b4ca0d5-a2f0-42bf-aed1-eeafa1139f26"  # Same as APP_ID
 APP_ID = "2b4ca0d5-a2f0-42bf-aed1-eeafa1139f26"  # Application ID registered in Entra
@@ -53,11 +59,10 @@ class AuthenticationHandler:
     def __init__(self, email: str, context: Context):
         logger.debug("Initializing AuthenticationHandler")
 
-        self.settings = utils.Settings()
-
         self.email = email
         self.context = context
         self.auth_database = AuthDatabase(path.STORE_DIR / AUTH_DATABASE_FILE_NAME)
+        self.cached_username = None  # Cleared when the session is added or removed
 
         logger.debug("Email: %s", self.email)
         logger.debug("Context: %s", self.context)
@@ -221,15 +226,17 @@ class AuthenticationHandler:
     def get_username(self) -> str:
         """
         Get the player username.
+        The username is cached, the session is only checked on the first call.
 
         Returns:
         - str: The player username.
         """
+        if self.cached_username is not None:
+            return self.cached_username
         session = self.get_session()
-        if session is None:
-            return ""
-        username = session.username
+        username = "" if session is None else session.username
         logger.debug("Username: %s", username)
+        self.cached_username = username
         return username
 
     def get_session(self) -> MicrosoftAuthSession:
@@ -264,7 +271,8 @@ class AuthenticationHandler:
         self.auth_database.load()
         self.auth_database.remove(self.email, MicrosoftAuthSession)
         self.auth_database.save()
-        self.settings.set_user(email="")
+        self.cached_username = None
+        SETTINGS.set_user(email="")
         logger.info("Session removed for '%s'", self.email)
 
     def authenticate(self) -> MicrosoftAuthSession:
@@ -277,6 +285,7 @@ class AuthenticationHandler:
         """
         session = self.get_session()
         if session is not None:
+            self.cached_username = None
             logger.debug("Returning existing session")
             return session
 
@@ -328,6 +337,22 @@ class AuthenticationHandler:
 
         self.auth_database.put(self.email, session)
         self.auth_database.save()
+        self.cached_username = None
         logger.debug("Session saved to database")
 
         return session
+
+
+@functools.lru_cache(maxsize=4)
+def get_auth_handler(email: str) -> AuthenticationHandler:
+    """
+    Get the shared AuthenticationHandler for an email.
+    Sharing the handler lets every window reuse its cached username.
+
+    Parameters:
+    - email (str): The email of the account.
+
+    Returns:
+    - AuthenticationHandler: The handler for the email.
+    """
+    return AuthenticationHandler(email=email, context=path.CONTEXT)
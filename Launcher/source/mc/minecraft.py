@@ -5,14 +5,31 @@ Classes:
 - MCManager: Handles Minecraft related tasks.
 - EnvironmentRunner: A runner that updates the GUI.
 - InstallWatcher: Observes and logs the installation process of a version install.
+
+Functions:
+- request_global_kill: Ask the install running in this process to stop.
+- clear_global_kill: Allow installs to run again after a global kill.
+- list_local_files: List the files under a directory.
+- get_mc: Get the shared MCManager.
+
+Variables:
+- GLOBAL_KILL_EVENT: Set while a global kill is in effect for this process.
 """
 
+from __future__ import annotations
+
+import array
+import concurrent.futures
+import functools
 import logging
+import sys
+import threading
 import time
 import os
 from pathlib import Path
-from subprocess import Popen
-from typing import Generator, List
+from subprocess import Popen, TimeoutExpired
+from types import MappingProxyType
+from typing import TYPE_CHECKING, ClassVar, Generator, Mapping
 from source import path, utils, exceptions
 from source.mc import remote
 from portablemc.auth import MicrosoftAuthSession
@@ -21,12 +38,55 @@ from portablemc.standard import Context, Version, SimpleWatcher, Environment, St
     VersionLoadingEvent, VersionFetchingEvent, VersionLoadedEvent, \
     JvmLoadingEvent, JvmLoadedEvent, JarFoundEvent, \
     AssetsResolveEvent, LibrariesResolvingEvent, LibrariesResolvedEvent, LoggerFoundEvent
-from portablemc.fabric import FabricVersion, FabricResolveEvent
-from portablemc.forge import ForgeVersion, _NeoForgeVersion, \
-    ForgeResolveEvent, ForgePostProcessingEvent, ForgePostProcessedEvent
+
+# The mod loader modules are only imported when the selected game needs them
+if TYPE_CHECKING:
+    from portablemc.fabric import FabricVersion, FabricResolveEvent
+    from portablemc.forge import ForgeVersion, _NeoForgeVersion, \
+        ForgeResolveEvent, ForgePostProcessingEvent, ForgePostProcessedEvent
 
 logger = logging.getLogger(__name__)
 
+SETTINGS = utils.Settings()
+
+PROGRESS_UPDATE_INTERVAL = 0.033  # Seconds between download progress updates, about 30 per second
+KILL_CHECK_INTERVAL = 1.0  # Seconds between checks for the global kill file
+SYNC_WORKERS = 8  # Default files downloaded at the same time when syncing a directory
+PROCESS_WAIT_INTERVAL = 0.1  # Seconds to wait on the game process between GUI updates
+
+GLOBAL_KILL_EVENT = threading.Event()
+
+
+def request_global_kill():
+    """
+    Ask the install running in this process to stop.
+    Watcher events and synced files check the event, so the install stops at the next one.
+    """
+    GLOBAL_KILL_EVENT.set()
+    logger.info("Global kill requested")
+
+
+def clear_global_kill():
+    """Allow installs to run again after a global kill, called when a new install starts."""
+    GLOBAL_KILL_EVENT.clear()
+
+def list_local_files(root_path: Path) -> set:
+    """
+    List the files under a directory with one directory read per folder.
+
+    Parameters:
+    - root_path (Path): The directory to list.
+
+    Returns:
+    - set: The paths of the files relative to root_path, with forward slashes.
+    """
+    local_files = set()
+    for dir_path, _, file_names in os.walk(root_path):
+        rel_dir = Path(dir_path).relative_to(root_path).as_posix()
+        prefix = "" if rel_dir == "." else rel_dir + "/"
+        local_files.update(prefix + file_name for file_name in file_names)
+    return local_files
+
 
 class InstallWatcher(SimpleWatcher):
     """
@@ -36,131 +96,227 @@ class InstallWatcher(SimpleWatcher):
     Attributes:
     app: Class to update the GUI.
     """
-    def __init__(self, app) -> None:  # pylint: disable=too-many-statements
-        self.app = app
-
-        def progress_task(key: str, **kwargs) -> None:
-            if key == "start.version.loading":
-                logger.debug("Loading version %s...", kwargs["version"])
-            elif key == "start.version.fetching":
-                logger.debug("Fetching version %s...", kwargs["version"])
-            elif key == "start.jvm.loading":
-                logger.debug("Loading JVM...")
-            elif key == "start.libraries.resolving":
-                logging.debug("Checking libraries...")
-            elif key == "start.forge.post_processing":
-                logger.debug("Forge post processing %s...", kwargs["task"])
-                self.app.update_item(f"Post Processing: {kwargs['task']}")
-            else:
-                logger.debug("Progress task: %s", key)
-
-        def finish_task(key: str, **kwargs) -> None:
-            if key == "start.version.loaded":
-                logger.info("Loaded version %s", kwargs["version"])
-            elif key == "start.version.loaded.fetched":
-                logger.info("Loaded version %s (fetched)", kwargs["version"])
-            elif key == f"start.jvm.loaded.{JvmLoadedEvent.MOJANG}":
-                logger.info("Loaded Mojang java %s", kwargs["version"])
-            elif key == f"start.jvm.loaded.{JvmLoadedEvent.BUILTIN}":
-                logger.info("Loaded builtin java %s", kwargs["version"])
-            elif key == f"start.jvm.loaded.{JvmLoadedEvent.CUSTOM}":
-                logger.info("Loaded custom java %s", kwargs["version"])
-            elif key == "start.jar.found":
-                logger.info("Checked version jar")
-            elif key == "start.logger.found":
-                logger.info("Using logger %s", kwargs["version"])
-            elif key == "start.forge.post_processed":
-                logger.info("Forge post processing done")
-                self.app.update_item("Post Processing Done")
-            else:
-                logger.info("Finished task: %s", key)
-
-        def assets_resolve(e: AssetsResolveEvent) -> None:
-            if e.count is None:
-                logger.debug("Resolving assets for version %s", e.index_version)
-            else:
-                logger.debug("Resolved %s assets for version %s", e.count, e.index_version)
+    # Attributes read on every download event are kept in slots instead of the instance dict
+    __slots__ = (
+        "app", "handlers", "entries_count", "total_size", "speeds", "sizes",
+        "speed_total", "size_total", "size", "last_progress_update", "last_kill_check",
+        "gui_dirty", "last_gui_update",
+    )
+
+    # Event type to the name of its handler, built once instead of for each watcher.
+    # Read only, since every watcher shares it.
+    DISPATCH: ClassVar[Mapping[type, str]] = MappingProxyType({
+        VersionLoadingEvent: "_on_version_loading",
+        VersionFetchingEvent: "_on_version_fetching",
+        VersionLoadedEvent: "_on_version_loaded",
+        JvmLoadingEvent: "_on_jvm_loading",
+        JvmLoadedEvent: "_on_jvm_loaded",
+        JarFoundEvent: "_on_jar_found",
+        AssetsResolveEvent: "_on_assets_resolve",
+        LibrariesResolvingEvent: "_on_libraries_resolving",
+        LibrariesResolvedEvent: "_on_libraries_resolved",
+        LoggerFoundEvent: "_on_logger_found",
+        DownloadStartEvent: "_on_download_start",
+        DownloadProgressEvent: "_on_download_progress",
+        DownloadCompleteEvent: "_on_download_complete",
+    })
+    # (module, event name) of mod loader events, only handled if the module was imported
+    LOADER_DISPATCH: ClassVar[Mapping[tuple, str]] = MappingProxyType({
+        ("portablemc.fabric", "FabricResolveEvent"): "_on_fabric_resolve",
+        ("portablemc.forge", "ForgeResolveEvent"): "_on_forge_resolve",
+        ("portablemc.forge", "ForgePostProcessingEvent"): "_on_forge_post_processing",
+        ("portablemc.forge", "ForgePostProcessedEvent"): "_on_forge_post_processed",
+    })
 
-        def libraries_resolved(e: LibrariesResolvedEvent) -> None:
-            logger.debug(
-                "Resolved %s class libraries and %s native libraries",
-                e.class_libs_count, e.native_libs_count
-            )
+    def __init__(self, app) -> None:
+        self.app = app
 
-        def fabric_resolve(e: FabricResolveEvent) -> None:
-            if e.loader_version is None:
-                logger.debug("Resolving %s loader for %s", e.api.name, e.vanilla_version)
-            else:
-                logger.debug("Resolved %s loader for %s", e.api.name, e.vanilla_version)
+        handlers = {event: getattr(self, name) for event, name in self.DISPATCH.items()}
+        for (module_name, event_name), name in self.LOADER_DISPATCH.items():
+            module = sys.modules.get(module_name)
+            if module is not None:
+                handlers[getattr(module, event_name)] = getattr(self, name)
+        super().__init__(handlers)
 
-        def forge_resolve(e: ForgeResolveEvent) -> None:
-            api = "forge"
-            if e.alias:
-                logger.debug("Resolving %s alias %s", api, e.forge_version)
-            else:
-                logger.debug("Resolved %s %s", api, e.forge_version)
+        self.entries_count: int
+        self.total_size: int
+        self.speeds: array.array  # Latest speed of each download thread
+        self.sizes: array.array  # Latest size of each download thread
+        self.speed_total = 0.0  # Running sum of speeds
+        self.size_total = 0  # Running sum of sizes
+        self.size = 0
+        self.last_progress_update = 0.0  # time.monotonic() of the last progress shown
+        self.last_kill_check = 0.0  # time.monotonic() of the last kill file check
+        self.gui_dirty = False  # An event changed the GUI since the last update
+        self.last_gui_update = 0.0  # time.monotonic() of the last GUI update
 
-        def func_resolve(func, *args, **kwargs) -> None:
-            """Alias for calling a function with args and kwargs."""
+    def check_global_kill(self):
+        """
+        Raise GlobalKill if a global kill was requested.
+        The event is checked on every call, the kill file at most once per interval.
+        """
+        if GLOBAL_KILL_EVENT.is_set():
+            raise exceptions.GlobalKill()
+        now = time.monotonic()
+        if now - self.last_kill_check >= KILL_CHECK_INTERVAL:
+            self.last_kill_check = now
             if os.path.exists(path.GLOBAL_KILL):
+                GLOBAL_KILL_EVENT.set()
                 raise exceptions.GlobalKill()
-            func(*args, **kwargs)
-            app.update_gui()
-
-        super().__init__({
-            VersionLoadingEvent: lambda e: func_resolve(
-                progress_task, "start.version.loading", version=e.version
-            ),
-            VersionFetchingEvent: lambda e: func_resolve(
-                progress_task, "start.version.fetching", version=e.version
-            ),
-            VersionLoadedEvent: lambda e: func_resolve(
-                finish_task,
-                "start.version.loaded.fetched" if e.fetched else "start.version.loaded",
-                version=e.version
-            ),
-            JvmLoadingEvent: lambda e: func_resolve(progress_task, "start.jvm.loading"),
-            JvmLoadedEvent: lambda e: func_resolve(
-                finish_task, f"start.jvm.loaded.{e.kind}", version=e.version or ""
-            ),
-            JarFoundEvent: lambda e: func_resolve(
-                finish_task, "start.jar.found"
-            ),
-            AssetsResolveEvent: lambda e: func_resolve(assets_resolve, e),
-            LibrariesResolvingEvent: lambda e: func_resolve(
-                progress_task, "start.libraries.resolving"
-            ),
-            LibrariesResolvedEvent: lambda e: func_resolve(libraries_resolved, e),
-            LoggerFoundEvent: lambda e: func_resolve(
-                finish_task, "start.logger.found", version=e.version
-            ),
-            FabricResolveEvent: lambda e: func_resolve(fabric_resolve, e),
-            ForgeResolveEvent: lambda e: func_resolve(forge_resolve, e),
-            ForgePostProcessingEvent: lambda e: func_resolve(
-                progress_task, "start.forge.post_processing", task=e.task
-            ),
-            ForgePostProcessedEvent: lambda e: func_resolve(
-                finish_task, "start.forge.post_processed"
-            ),
-            DownloadStartEvent: lambda e: self.object_func_resolve(self.download_start, e),
-            DownloadProgressEvent: lambda e: self.object_func_resolve(self.download_progress, e),
-            DownloadCompleteEvent: lambda e: self.object_func_resolve(self.download_complete, e),
-        })
 
-        self.app = app
+    def func_resolve(self, func, *args, **kwargs) -> None:
+        """Alias for calling a function with args and kwargs, then updating the GUI."""
+        self.check_global_kill()
+        func(*args, **kwargs)
+        self.gui_dirty = True
+        self.flush_gui()
 
-        self.entries_count: int
-        self.total_size: int
-        self.speeds: List[float]
-        self.sizes: List[int]
-        self.size = 0
+    def flush_gui(self, force=False) -> None:
+        """
+        Update the GUI if an event changed it, at most once per interval.
+
+        Parameters:
+        - force (bool): Update the GUI even if the interval has not passed. Defaults to False.
+        """
+        if not self.gui_dirty:
+            return
+        now = time.monotonic()
+        if force or now - self.last_gui_update >= PROGRESS_UPDATE_INTERVAL:
+            self.gui_dirty = False
+            self.last_gui_update = now
+            self.app.update_gui()
 
     def object_func_resolve(self, func, *args, **kwargs):
         """Alias for calling a function with args and kwargs."""
-        if os.path.exists(path.GLOBAL_KILL):
-            raise exceptions.GlobalKill()
+        self.check_global_kill()
         func(*args, **kwargs)
 
+    def progress_task(self, key: str, **kwargs) -> None:
+        """Log the start of an installation task."""
+        if key == "start.version.loading":
+            logger.debug("Loading version %s...", kwargs["version"])
+        elif key == "start.version.fetching":
+            logger.debug("Fetching version %s...", kwargs["version"])
+        elif key == "start.jvm.loading":
+            logger.debug("Loading JVM...")
+        elif key == "start.libraries.resolving":
+            logging.debug("Checking libraries...")
+        elif key == "start.forge.post_processing":
+            logger.debug("Forge post processing %s...", kwargs["task"])
+            self.app.update_item(f"Post Processing: {kwargs['task']}")
+        else:
+            logger.debug("Progress task: %s", key)
+
+    def finish_task(self, key: str, **kwargs) -> None:
+        """Log the end of an installation task."""
+        if key == "start.version.loaded":
+            logger.info("Loaded version %s", kwargs["version"])
+        elif key == "start.version.loaded.fetched":
+            logger.info("Loaded version %s (fetched)", kwargs["version"])
+        elif key == f"start.jvm.loaded.{JvmLoadedEvent.MOJANG}":
+            logger.info("Loaded Mojang java %s", kwargs["version"])
+        elif key == f"start.jvm.loaded.{JvmLoadedEvent.BUILTIN}":
+            logger.info("Loaded builtin java %s", kwargs["version"])
+        elif key == f"start.jvm.loaded.{JvmLoadedEvent.CUSTOM}":
+            logger.info("Loaded custom java %s", kwargs["version"])
+        elif key == "start.jar.found":
+            logger.info("Checked version jar")
+        elif key == "start.logger.found":
+            logger.info("Using logger %s", kwargs["version"])
+        elif key == "start.forge.post_processed":
+            logger.info("Forge post processing done")
+            self.app.update_item("Post Processing Done")
+        else:
+            logger.info("Finished task: %s", key)
+
+    @staticmethod
+    def assets_resolve(e: AssetsResolveEvent) -> None:
+        """Log the assets being resolved."""
+        if e.count is None:
+            logger.debug("Resolving assets for version %s", e.index_version)
+        else:
+            logger.debug("Resolved %s assets for version %s", e.count, e.index_version)
+
+    @staticmethod
+    def libraries_resolved(e: LibrariesResolvedEvent) -> None:
+        """Log the resolved libraries."""
+        logger.debug(
+            "Resolved %s class libraries and %s native libraries",
+            e.class_libs_count, e.native_libs_count
+        )
+
+    @staticmethod
+    def fabric_resolve(e: FabricResolveEvent) -> None:
+        """Log the fabric loader being resolved."""
+        if e.loader_version is None:
+            logger.debug("Resolving %s loader for %s", e.api.name, e.vanilla_version)
+        else:
+            logger.debug("Resolved %s loader for %s", e.api.name, e.vanilla_version)
+
+    @staticmethod
+    def forge_resolve(e: ForgeResolveEvent) -> None:
+        """Log the forge version being resolved."""
+        api = "forge"
+        if e.alias:
+            logger.debug("Resolving %s alias %s", api, e.forge_version)
+        else:
+            logger.debug("Resolved %s %s", api, e.forge_version)
+
+    def _on_version_loading(self, e: VersionLoadingEvent) -> None:
+        self.func_resolve(self.progress_task, "start.version.loading", version=e.version)
+
+    def _on_version_fetching(self, e: VersionFetchingEvent) -> None:
+        self.func_resolve(self.progress_task, "start.version.fetching", version=e.version)
+
+    def _on_version_loaded(self, e: VersionLoadedEvent) -> None:
+        self.func_resolve(
+            self.finish_task,
+            "start.version.loaded.fetched" if e.fetched else "start.version.loaded",
+            version=e.version
+        )
+
+    def _on_jvm_loading(self, _: JvmLoadingEvent) -> None:
+        self.func_resolve(self.progress_task, "start.jvm.loading")
+
+    def _on_jvm_loaded(self, e: JvmLoadedEvent) -> None:
+        self.func_resolve(self.finish_task, f"start.jvm.loaded.{e.kind}", version=e.version or "")
+
+    def _on_jar_found(self, _: JarFoundEvent) -> None:
+        self.func_resolve(self.finish_task, "start.jar.found")
+
+    def _on_assets_resolve(self, e: AssetsResolveEvent) -> None:
+        self.func_resolve(self.assets_resolve, e)
+
+    def _on_libraries_resolving(self, _: LibrariesResolvingEvent) -> None:
+        self.func_resolve(self.progress_task, "start.libraries.resolving")
+
+    def _on_libraries_resolved(self, e: LibrariesResolvedEvent) -> None:
+        self.func_resolve(self.libraries_resolved, e)
+
+    def _on_logger_found(self, e: LoggerFoundEvent) -> None:
+        self.func_resolve(self.finish_task, "start.logger.found", version=e.version)
+
+    def _on_fabric_resolve(self, e: FabricResolveEvent) -> None:
+        self.func_resolve(self.fabric_resolve, e)
+
+    def _on_forge_resolve(self, e: ForgeResolveEvent) -> None:
+        self.func_resolve(self.forge_resolve, e)
+
+    def _on_forge_post_processing(self, e: ForgePostProcessingEvent) -> None:
+        self.func_resolve(self.progress_task, "start.forge.post_processing", task=e.task)
+
+    def _on_forge_post_processed(self, _: ForgePostProcessedEvent) -> None:
+        self.func_resolve(self.finish_task, "start.forge.post_processed")
+
+    def _on_download_start(self, e: DownloadStartEvent) -> None:
+        self.object_func_resolve(self.download_start, e)
+
+    def _on_download_progress(self, e: DownloadProgressEvent) -> None:
+        self.object_func_resolve(self.download_progress, e)
+
+    def _on_download_complete(self, e: DownloadCompleteEvent) -> None:
+        self.object_func_resolve(self.download_complete, e)
+
     def download_start(self, e: DownloadStartEvent):
         """
         Called when download starts.
@@ -169,13 +325,16 @@ class InstallWatcher(SimpleWatcher):
         """
         self.entries_count = e.entries_count
         self.total_size = e.size
-        self.speeds = [0.0] * e.threads_count
-        self.sizes = [0] * e.threads_count
+        # Unboxed values, a new value is stored for every progress event
+        self.speeds = array.array("d", [0.0]) * e.threads_count
+        self.sizes = array.array("q", [0]) * e.threads_count
+        self.speed_total = 0.0
+        self.size_total = 0
         self.size = 0
+        self.last_progress_update = 0.0
 
         self.app.update_title("Provisioning Environment")
         self.app.reset_progress()
-        self.entries_count = self.entries_count
 
     def download_progress(self, e: DownloadProgressEvent) -> None:
         """
@@ -183,22 +342,30 @@ class InstallWatcher(SimpleWatcher):
         
         Updates the progress bar and the item message with install info.
         """
+        # Keep the totals current instead of summing every thread on each event
+        self.speed_total += e.speed - self.speeds[e.thread_id]
+        self.size_total += e.size - self.sizes[e.thread_id]
         self.speeds[e.thread_id] = e.speed  # Store speed for later
         self.sizes[e.thread_id] = e.size  # Store size for later
-
-        speed = sum(self.speeds)  # Sum speeds to get total speed
-        total_count = str(self.entries_count)  # Total count of entries
-        count = f"{e.count:{len(total_count)}}"  # Pad count with zeros
-        size = f"{utils.format_number(self.size + sum(self.sizes))}B"  # Sum sizes to get total size
-        speed = f"{utils.format_number(speed)}B/s"  # Format speed
+        downloaded = self.size + self.size_total
 
         if e.done:
             logger.debug("File Downloaded: %s", e.entry)
             self.size += e.size
 
+        # Events arrive far faster than the GUI can redraw, only show about one per frame.
+        # The last entry is always shown so the progress bar ends full.
+        now = time.monotonic()
+        if now - self.last_progress_update < PROGRESS_UPDATE_INTERVAL \
+                and e.count != self.entries_count:
+            return
+        self.last_progress_update = now
+
+        size = f"{utils.format_number(downloaded)}B"
+        speed = f"{utils.format_number(self.speed_total)}B/s"  # Format speed
+
         item_msg = f"Total Downloaded: {size:>8} - {speed}"
-        self.app.update_item(item_msg)
-        self.app.update_progress(int(count) / int(total_count))
+        self.app.update_status(item_msg, e.count / self.entries_count)
 
     def download_complete(self, _: DownloadCompleteEvent) -> None:
         """
@@ -209,6 +376,7 @@ class InstallWatcher(SimpleWatcher):
         logger.info("Download complete")
         self.app.update_item("Download Complete")
         self.app.progress_indeterminate()
+        self.flush_gui(force=True)
 
 
 class EnvironmentRunner(StandardRunner):
@@ -218,18 +386,25 @@ class EnvironmentRunner(StandardRunner):
     Attributes:
     - app: The app to update.
     """
+    __slots__ = ("app",)
+
     def __init__(self, app) -> None:
         self.app = app
 
     def process_wait(self, process: Popen) -> None:
-        while process.poll() is None:
+        while True:
+            # Blocks until the game exits or the timeout, so the exit is noticed right away
+            try:
+                process.wait(timeout=PROCESS_WAIT_INTERVAL)
+                break
+            except TimeoutExpired:
+                pass
             if self.app.kill_process:
                 process.kill()
+                process.wait()
                 break
             self.app.update_gui()
-            time.sleep(0.1)
 
-        process.wait()
         self.app.on_run_complete()
 
 
@@ -240,26 +415,35 @@ class MCManager:
     Attributes:
     - context: The context for PortableMC.
     - remote_tree: The remote tree for PortableMC.
+    - remote_urls: The download URL of each path in the remote tree.
+    - remote_blobs: The blob SHA and size of each file in the remote tree.
     - remote_config: The remote config for PortableMC.
     - server_ip: The server IP.
     - server_port: The server port.
     - game_selected: The game selected.
+    - download_threads: The number of files downloaded at the same time when syncing.
 
     Methods:
+    - get_download_threads: Get the number of sync download threads from the remote config.
     - create_vanilla_version: Create vanilla root.
     - create_fabric_version: Create fabric root.
     - create_quilt_version: Create quilt root.
     - create_forge_version: Create forge root.
     - create_neoforge_version: Create neoforge root.
     - provision_version: Provisions a version based on server.
+    - install_vanilla: Install the vanilla game files under a mod loader.
     - provision_environment: Provisions an environment for the version to run.
+    - is_file_current: Check if a local file has the same content as the file on the server.
     - sync: Syncs the local data folder with the server.
     """
+    __slots__ = (
+        "context", "remote_tree", "remote_config", "remote_urls", "remote_blobs",
+        "server_ip", "server_port", "game_selected", "download_threads",
+    )
+
     def __init__(self, context: Context):
         logger.debug("Initializing MCManager")
 
-        self.settings = utils.Settings()
-
         self.context = context
         self.remote_tree = remote.get_repo_tree()
         self.remote_config = remote.get_config(self.remote_tree)
@@ -268,18 +452,42 @@ class MCManager:
             raise exceptions.RemoteError("Remote config not found")
         if self.remote_tree is None:
             raise exceptions.RemoteError("Remote tree not found")
+        self.remote_urls: dict = remote.get_file_urls(self.remote_tree)
+        self.remote_blobs: dict = remote.get_file_blobs(self.remote_tree)
 
         self.server_ip: str = self.remote_config.get("startup", {}).get("server_ip", "")
         self.server_port: int = self.remote_config.get("startup", {}).get("server_port", "")
         self.game_selected: str = self.remote_config.get("startup", {}).get("game", "")
+        self.download_threads: int = self.get_download_threads()
 
         logger.debug("Context: %s", self.context)
         logger.debug("Server IP: %s", self.server_ip)
         logger.debug("Server Port: %s", self.server_port)
         logger.debug("Game Selected: %s", self.game_selected)
+        logger.debug("Download Threads: %s", self.download_threads)
 
         logger.debug("MCManager initialized")
 
+    def get_download_threads(self) -> int:
+        """
+        Get the number of sync download threads from the remote config.
+
+        Returns:
+        - int: The thread count, limited to 1 through remote.POOL_SIZE.
+            SYNC_WORKERS if the config doesn't set a valid number.
+        """
+        download_threads = self.remote_config.get("startup", {}).get("download_threads")
+        if download_threads is None:
+            return SYNC_WORKERS
+        try:
+            download_threads = int(download_threads)
+        except (TypeError, ValueError):
+            logger.warning(
+                "Invalid download_threads '%s', using %d", download_threads, SYNC_WORKERS
+            )
+            return SYNC_WORKERS
+        return min(max(download_threads, 1), remote.POOL_SIZE)
+
     def create_vanilla_version(self, mc_version: str=None) -> Version:
         """
         Create vanilla root.
@@ -308,6 +516,7 @@ class MCManager:
         """
         logger.debug("mc_version: %s", mc_version)
         logger.debug("loader_version: %s", loader_version)
+        from portablemc.fabric import FabricVersion  # pylint: disable=import-outside-toplevel
         if mc_version is None:
             mc_version = "release"
         return FabricVersion.with_fabric(
@@ -329,6 +538,7 @@ class MCManager:
         """
         logger.debug("mc_version: %s", mc_version)
         logger.debug("loader_version: %s", loader_version)
+        from portablemc.fabric import FabricVersion  # pylint: disable=import-outside-toplevel
         if mc_version is None:
             mc_version = "release"
         return FabricVersion.with_quilt(
@@ -348,6 +558,7 @@ class MCManager:
         """
         logger.debug("mc_version: %s", mc_version)
         logger.debug("forge_version: %s", forge_version)
+        from portablemc.forge import ForgeVersion  # pylint: disable=import-outside-toplevel
         if forge_version is None:
             forge_version = "recommended"
 
@@ -369,6 +580,7 @@ class MCManager:
         - _NeoForgeVersion: Neoforge version.
         """
         logger.debug("mc_version: %s", mc_version)
+        from portablemc.forge import _NeoForgeVersion  # pylint: disable=import-outside-toplevel
         return _NeoForgeVersion(neoforge_version=mc_version, context=self.context)
 
     def provision_version(
@@ -421,6 +633,29 @@ class MCManager:
 
         return version
 
+    def install_vanilla(self, mc_version: str=None, watcher: InstallWatcher=None) -> None:
+        """
+        Install the vanilla game files under a mod loader.
+        Skipped when the same vanilla version was already installed by an earlier launch.
+
+        Parameters:
+        - mc_version (str): Version of Minecraft.
+        - watcher (InstallWatcher): The watcher for PortableMC. Defaults to None.
+        """
+        # Aliases like "release" can point to a new version, only exact versions are remembered
+        is_exact = mc_version not in (None, "release", "snapshot")
+        if is_exact and path.VANILLA_INSTALLED.exists():
+            if path.VANILLA_INSTALLED.read_text(encoding="utf-8") == mc_version:
+                logger.debug("Vanilla %s already installed, skipping", mc_version)
+                return
+
+        self.create_vanilla_version(mc_version).install(watcher=watcher)
+
+        if is_exact:
+            path.VANILLA_INSTALLED.write_text(mc_version, encoding="utf-8")
+        elif path.VANILLA_INSTALLED.exists():
+            path.VANILLA_INSTALLED.unlink()
+
     def provision_environment(
             self,
             version: Version | FabricVersion | ForgeVersion | _NeoForgeVersion,
@@ -441,21 +676,45 @@ class MCManager:
         logger.debug("version: %s", version)
         logger.debug("auth_session: %s", auth_session)
         logger.debug("watcher: %s", watcher)
-        # force install of normal game files
-        vanilla_mc_version = self.create_vanilla_version(
-            self.remote_config["games"][self.game_selected]["mc_version"]
-        )
-        vanilla_mc_version.install(watcher=watcher)
+        # force install of normal game files, a vanilla game already installs them below
+        if self.game_selected != "vanilla":
+            self.install_vanilla(
+                self.remote_config["games"][self.game_selected]["mc_version"], watcher=watcher
+            )
 
         version.auth_session = auth_session
         env = version.install(watcher=watcher)
-        args = self.settings.get_game("ram_jvm_args") + \
-            self.settings.get_game("additional_jvm_args")
+        ram_allocation = SETTINGS.get_game("ram_allocation")
+        args = [f"-Xms{ram_allocation}M", f"-Xmx{ram_allocation}M"] + \
+            SETTINGS.get_game("additional_jvm_args").split()
         env.jvm_args.extend(args)
         return env
 
+    def is_file_current(self, remote_path: str, root_path: Path) -> bool:
+        """
+        Check if a local file has the same content as the file on the server.
+        The size is compared first, the file is only hashed when the sizes match.
+
+        Parameters:
+        - remote_path (str): The remote path.
+        - root_path (Path): The local path of the file.
+
+        Returns:
+        - bool: Whether or not the local file matches the server.
+        """
+        blob = self.remote_blobs.get(remote_path)
+        if blob is None:
+            return False
+        sha, size = blob
+        try:
+            if root_path.stat().st_size != size:
+                return False
+            return remote.git_blob_sha(root_path) == sha
+        except OSError:
+            return False
+
     def _sync_file(
-            self, remote_path: str, root_path: Path, overwrite: bool, app=None
+            self, remote_path: str, root_path: Path, overwrite: bool, app=None, make_parents=True
         ) -> bool:
         """
         Syncs the specified file with the server.
@@ -465,22 +724,37 @@ class MCManager:
         - remote_path (str): The remote path.
         - root_path (Path): The root path to place the file.
         - overwrite (bool): Whether or not to overwrite existing files.
+        - make_parents (bool): Whether or not to create the parent directories. Defaults to True.
 
         Returns:
         - bool: Whether or not the file was downloaded.
         """
+        if GLOBAL_KILL_EVENT.is_set():
+            raise exceptions.GlobalKill()
+
         if app:
             app.update_title(remote_path)
             app.reset_progress()
             app.update_item(remote_path)
 
-        file_url = remote.get_file_url(self.remote_tree, remote_path)
+        # Checked before the URL lookup, an existing file is kept when not overwriting
+        if not overwrite and root_path.exists():
+            logger.debug("Skipping '%s' because it already exists", remote_path)
+            return False
+
+        file_url = self.remote_urls.get(remote_path)
         if file_url is None:
             logger.warning("'%s' not found on the server", remote_path)
             return False
 
         # Form directory path
-        root_path.parent.mkdir(parents=True, exist_ok=True)
+        if make_parents:
+            root_path.parent.mkdir(parents=True, exist_ok=True)
+
+        # Keep an existing file that matches the server, there is nothing to overwrite
+        if overwrite and self.is_file_current(remote_path, root_path):
+            logger.debug("Skipping '%s' because it matches the server", remote_path)
+            return False
 
         # Delete the file if it exists and overwrite is True
         if overwrite and root_path.exists():
@@ -511,55 +785,89 @@ class MCManager:
         app.update_title(remote_path)
         app.reset_progress()
 
-        dir_paths = remote.get_dir_paths(self.remote_tree, remote_path)
-        len_all_paths = len(dir_paths)
+        dir_entries = remote.get_dir_paths(self.remote_tree, remote_path)
+        len_all_paths = len(dir_entries)
 
-        exclude_list: None | list = self.remote_config["paths"][remote_path]["exclude"]
-        delete_others: bool = self.remote_config["paths"][remote_path]["delete_others"]
+        entry = self.remote_config["paths"][remote_path]
+        exclude_list: None | list = entry["exclude"]
+        delete_others: bool = entry["delete_others"]
         logger.debug("Exclude List: %s, Delete Others: %s", exclude_list, delete_others)
+        exclude_items = tuple(exclude_list or ())  # Converted once for the substring scans
 
-        # Filter out excluded paths from dir_paths
-        if exclude_list:
-            dir_paths = [
-                dir_path for dir_path in dir_paths
-                if not any(exclude_item in dir_path for exclude_item in exclude_list)
+        # Filter out excluded paths from dir_entries
+        if exclude_items:
+            dir_entries = [
+                (dir_path, is_dir) for dir_path, is_dir in dir_entries
+                if not any(exclude_item in dir_path for exclude_item in exclude_items)
             ]
+        dir_paths = [dir_path for dir_path, _ in dir_entries]
+
+        # Files already on disk, looked up in memory instead of a stat per file
+        local_files = list_local_files(root_path)
 
         # Delete other files
         if delete_others:
-            for local_file in root_path.rglob("*"):  # Recursively iterate over all files
-                # Del file if it is a file, not in exclude_list, and not in dir_paths
+            # File names on the server, looked up by hash instead of searching every path
+            remote_names = {dir_path.rpartition("/")[2] for dir_path in dir_paths}
+            for local_file in list(local_files):
+                local_file_name = local_file.rpartition("/")[2]
+                # Del file if it is not in exclude_list, and not in dir_paths
                 if (
-                    local_file.is_file()
-                    and (
-                        not exclude_list or  # Returns True if list not provided
-                        not any(exclude_item in local_file.name for exclude_item in exclude_list)
-                    )
-                    and all(local_file.name not in remote_dir_item for remote_dir_item in dir_paths)
+                    local_file_name not in remote_names
+                    and not any(exclude_item in local_file_name for exclude_item in exclude_items)
                 ):
-                    local_file.unlink()
-                    logger.debug("Deleted unknown file: %s", local_file.name)
-
-        total_downloaded = 0
-        for remote_dir_item in dir_paths:
+                    (root_path / local_file).unlink()
+                    local_files.discard(local_file)
+                    logger.debug("Deleted unknown file: %s", local_file_name)
+
+        files = []  # (remote path, item name, local path) of every file to sync
+        local_dirs = set()  # Remote directories and the directories the files are placed in
+        prefix_len = len(remote_path)
+        for remote_dir_item, is_dir in dir_entries:
             # Remove the remote path from the item
-            item_name = remote_dir_item[len(remote_path):].lstrip("/")
+            item_name = remote_dir_item[prefix_len:].lstrip("/")
+
+            if is_dir:
+                local_dirs.add(root_path / item_name)
+                continue
+            if not overwrite and item_name in local_files:
+                logger.debug("Skipping '%s' because it already exists", remote_dir_item)
+                continue
             # Local path relative to data folder
             local_save_path: Path = root_path / item_name
             logger.debug("Local Save Path: %s", local_save_path)
-            app.update_item(item_name)
+            files.append((remote_dir_item, item_name, local_save_path))
+            local_dirs.add(local_save_path.parent)
 
-            # If there is no file extension, it is a directory
-            if not local_save_path.suffix:
-                local_save_path.mkdir(parents=True, exist_ok=True)
-                logger.debug("Created directory: %s", local_save_path)
-                continue
+        # Create each directory once instead of once per file
+        for local_dir in local_dirs:
+            local_dir.mkdir(parents=True, exist_ok=True)
+            logger.debug("Created directory: %s", local_dir)
 
-            # Download the file
-            downloaded = self._sync_file(remote_dir_item, local_save_path, overwrite)
-            if downloaded:
-                total_downloaded += 1
-            app.update_progress(total_downloaded / len_all_paths)
+        # Download the files in parallel, the GUI is updated as each one finishes
+        total_downloaded = 0
+        with concurrent.futures.ThreadPoolExecutor(
+            max_workers=self.download_threads, thread_name_prefix="sync"
+        ) as executor:
+            futures = {
+                executor.submit(
+                    self._sync_file, remote_dir_item, local_save_path, overwrite,
+                    make_parents=False
+                ): item_name
+                for remote_dir_item, item_name, local_save_path in files
+            }
+            for future in concurrent.futures.as_completed(futures):
+                try:
+                    if GLOBAL_KILL_EVENT.is_set():
+                        raise exceptions.GlobalKill()
+                    downloaded = future.result()
+                except Exception:
+                    for pending in futures:  # Don't start the rest, then report the error
+                        pending.cancel()
+                    raise
+                if downloaded:
+                    total_downloaded += 1
+                app.update_status(futures[future], total_downloaded / len_all_paths)
 
     def sync(self, app) -> Generator[tuple, None, None]:
         """
@@ -573,15 +881,16 @@ class MCManager:
         app.update_title("Beginning Sync")
         app.progress_indeterminate()
 
-        for remote_path in self.remote_config["paths"]:
+        work_dir = self.context.work_dir
+        for remote_path, entry in self.remote_config["paths"].items():
             # Bool to determine if path is a directory
-            is_dir: bool = self.remote_config["paths"][remote_path]["is_dir"]
+            is_dir: bool = entry["is_dir"]
             # Local path relative to data folder
-            root: str = self.remote_config["paths"][remote_path]["root"]
+            root: str = entry["root"]
             # Whether or not to overwrite existing files
-            overwrite: bool = self.remote_config["paths"][remote_path]["overwrite"]
+            overwrite: bool = entry["overwrite"]
 
-            local_path_root = self.context.work_dir / root
+            local_path_root = work_dir / root
 
             logger.debug(
                 "Remote Path: %s, Is Dir: %s, Root: %s, Local Path Root: %s, Overwrite: %s",
@@ -593,3 +902,16 @@ class MCManager:
                 continue
 
             self._sync_dir(remote_path, local_path_root, overwrite, app=app)
+
+
+@functools.lru_cache(maxsize=None)
+def get_mc() -> MCManager:
+    """
+    Get the shared MCManager.
+    The manager is created on first use and kept until get_mc.cache_clear() is called,
+    which each install does so it syncs against the current remote tree and config.
+
+    Returns:
+    - MCManager: The shared MCManager.
+    """
+    return MCManager(context=path.CONTEXT)
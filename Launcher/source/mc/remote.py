@@ -9,20 +9,33 @@ Functions:
         url: str, timeout=5, retries=3, backoff_factor=0.3, headers=None, **kwargs
     ) -> requests.models.Response
     Send a GET request to the specified URL.
-- download(url: str = None, save_path: str | Path = None, chunk_size=8192) -> str | None
+- download(
+        url: str = None, save_path: str | Path = None, chunk_size=DOWNLOAD_CHUNK_SIZE
+    ) -> str | None
     Download a file from the server.
 - get_repo_tree() -> dict
     Retrieve the repository tree from the server.
 - get_file_url(tree: dict, dir_path: str) -> dict
     Retrieve the download URL for the specified file.
+- get_file_urls(tree: dict) -> dict
+    Map every path in the repository tree to its download URL.
+- get_file_blobs(tree: dict) -> dict
+    Map every file in the repository tree to its blob SHA and size.
+- git_blob_sha(file_path: str | Path, chunk_size=DOWNLOAD_CHUNK_SIZE) -> str
+    Compute the git blob SHA of a local file.
 - get_dir_paths(tree: dict, dir_path: str) -> list
-    Retrieve a list of all paths in the specified directory.
+    Retrieve a list of all paths in the specified directory and whether each is a directory.
 - get_config(tree) -> dict
     Retrieve the config file from the server.
 
 Constants:
 - GITHUB_CONTENTS_BASE (str): The base URL for the GitHub contents API.
 - CONFIG_PATH (str): The path of the config file on the server.
+- DOWNLOAD_CHUNK_SIZE (int): The number of bytes read from a response at a time.
+- POOL_SIZE (int): The number of connections kept open to each host.
+
+Variables:
+- SESSION (requests.Session): The shared session, reusing connections across requests.
 """
 
 from io import BufferedReader
@@ -30,12 +43,14 @@ from pathlib import Path
 from typing import List
 import logging
 import base64
+import hashlib
 import json
 import tempfile
 import time
 import os
 import requests
 import yaml
+from requests.adapters import HTTPAdapter
 from source import path, creds, exceptions
 
 logger = logging.getLogger(__name__)
@@ -43,6 +58,21 @@ logger = logging.getLogger(__name__)
 GITHUB_CONTENTS_BASE = \
     r"https://api.github.com/repos/Trogiken/Hominum-Updates/git/trees/master?recursive=1"
 CONFIG_PATH = "config.yaml"
+DOWNLOAD_CHUNK_SIZE = 1024 * 1024  # Large reads mean fewer write calls on fast connections
+POOL_SIZE = 32  # Enough for every sync download thread to keep its own connection
+
+
+def _create_session() -> requests.Session:
+    """Create a session with a connection pool large enough for the sync threads."""
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=POOL_SIZE, pool_maxsize=POOL_SIZE)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+# Keep-alive connections are reused, so each request doesn't need a new TLS handshake
+SESSION = _create_session()
 
 
 def decode_base64(file_path: str | Path, chunk_size=8192) -> None:
@@ -79,7 +109,10 @@ def decode_base64(file_path: str | Path, chunk_size=8192) -> None:
         # Create a temporary file to store decoded content
         logger.debug("Decoding base64 content from '%s'", file_path)
         with open(file_path, "rb") as file:
-            temp_decode_file = tempfile.NamedTemporaryFile(dir=path.DOWNLOAD_DIR, delete=False)
+            # Next to the original file, so it can be moved over it instead of copied
+            temp_decode_file = tempfile.NamedTemporaryFile(
+                dir=os.path.dirname(file_path), delete=False
+            )
             with temp_decode_file:
                 while True:
                     # Read the next chunk from the raw file
@@ -99,14 +132,9 @@ def decode_base64(file_path: str | Path, chunk_size=8192) -> None:
                             message_bytes = base64.b64decode(base64_bytes)
                             temp_decode_file.write(message_bytes)
 
-        # Read the decoded content from the temp file and write it back to the original file
+        # Replace the original file with the decoded content
         logger.debug("Writing decoded content to '%s'", file_path)
-        with open(temp_decode_file.name, "rb") as temp_file, open(file_path, "wb") as file:
-            while True:
-                chunk = temp_file.read(chunk_size)
-                if not chunk:
-                    break
-                file.write(chunk)
+        os.replace(temp_decode_file.name, file_path)
     except Exception as error:
         raise exceptions.Base64DecodeError(f"Failed to decode '{file_path}': {error}")
     finally:
@@ -142,10 +170,9 @@ def get_request(
     else:
         headers['Authorization'] = f'token {creds.get_api_key()}'
 
-    session = requests.Session()
     for retry in range(retries):
         try:
-            resp = session.get(url, timeout=timeout, headers=headers, **kwargs)
+            resp = SESSION.get(url, timeout=timeout, headers=headers, **kwargs)
             resp.raise_for_status()
             return resp
         except (requests.exceptions.Timeout, requests.exceptions.ConnectionError) as error:
@@ -157,7 +184,9 @@ def get_request(
     return None
 
 
-def download(url: str = None, save_path: str | Path = None, chunk_size=8192) -> str | None:
+def download(
+        url: str = None, save_path: str | Path = None, chunk_size=DOWNLOAD_CHUNK_SIZE
+    ) -> str | None:
     """
     Downloads a stream of bytes from the given URL and saves it to the specified path.
 
@@ -165,7 +194,7 @@ def download(url: str = None, save_path: str | Path = None, chunk_size=8192) ->
     - url (str): The URL to download the file from. (File must be base64 encoded)
     - save_path (str | Path): The path to save the downloaded file.
         If not specified, the content will be returned as a string.
-    - chunk_size (int): The size of the chunks to download. Defaults to 8192.
+    - chunk_size (int): The size of the chunks to download. Defaults to DOWNLOAD_CHUNK_SIZE.
 
     Returns:
     - str: The path where the file was saved. Or the content if save_path is not specified.
@@ -204,7 +233,7 @@ def download(url: str = None, save_path: str | Path = None, chunk_size=8192) ->
                 logger.debug("Read content from '%s'", file_path)
             return content
 
-        os.rename(file_path, save_path)  # Move temp file to save path
+        os.replace(file_path, save_path)  # Move temp file to save path
         logger.debug("Moved '%s' to '%s'", file_path, save_path)
         return save_path
     except Exception as error:
@@ -258,6 +287,59 @@ def get_file_url(tree: dict, dir_path: str) -> dict:
     return None
 
 
+def get_file_urls(tree: dict) -> dict:
+    """
+    Maps every path in the repository tree to its download URL.
+    Looking up many files in the map avoids scanning the tree for each one.
+
+    Parameters:
+    - tree (dict): The repository tree.
+
+    Returns:
+    - dict: The download URL of each path on the server.
+    """
+    if not tree:
+        return {}
+    return {file["path"]: file["url"] for file in tree}
+
+
+def get_file_blobs(tree: dict) -> dict:
+    """
+    Maps every file in the repository tree to its blob SHA and size.
+
+    Parameters:
+    - tree (dict): The repository tree.
+
+    Returns:
+    - dict: (sha, size) of each file path on the server.
+    """
+    if not tree:
+        return {}
+    return {file["path"]: (file["sha"], file["size"]) for file in tree if file["type"] == "blob"}
+
+
+def git_blob_sha(file_path: str | Path, chunk_size=DOWNLOAD_CHUNK_SIZE) -> str:
+    """
+    Computes the git blob SHA of a local file, the same hash the repository tree lists.
+
+    Parameters:
+    - file_path (str | Path): The path to the file.
+    - chunk_size (int): The size of the chunks to read from the file.
+        Defaults to DOWNLOAD_CHUNK_SIZE.
+
+    Returns:
+    - str: The hex digest of the blob.
+    """
+    blob_hash = hashlib.sha1(f"blob {os.path.getsize(file_path)}\0".encode())
+    with open(file_path, "rb") as file:
+        while True:
+            chunk = file.read(chunk_size)
+            if not chunk:
+                break
+            blob_hash.update(chunk)
+    return blob_hash.hexdigest()
+
+
 def get_dir_paths(tree: dict, dir_path: str) -> list:
     """
     Retrieves a list of all paths in the specified directory.
@@ -267,7 +349,7 @@ def get_dir_paths(tree: dict, dir_path: str) -> list:
     - dir_path (str): The path to the directory on the server.
 
     Returns:
-    - list: A list of directory paths.
+    - list: (path, is_dir) tuples, is_dir is True for directories in the tree.
     - None: If the response is empty.
     """
     if not tree:
@@ -275,7 +357,7 @@ def get_dir_paths(tree: dict, dir_path: str) -> list:
     paths = []
     for file in tree:
         if file["path"].startswith(dir_path):
-            paths.append(file["path"])
+            paths.append((file["path"], file["type"] == "tree"))
     logger.debug("'%s' Paths: %s", dir_path, paths)
 
     return paths
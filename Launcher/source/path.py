@@ -13,6 +13,7 @@ Constants:
 - WORK_DIR (pathlib.Path): The directory of the working data.
 - CONTEXT (Context): The context of the program.
 - GLOBAL_KILL (pathlib.Path): The global kill switch.
+- VANILLA_INSTALLED (pathlib.Path): Holds the last vanilla version installed for a mod loader.
 """
 
 import logging
@@ -39,6 +40,7 @@ MAIN_DIR = pathlib.Path(os.path.join(STORE_DIR, "minecraft"))
 WORK_DIR = pathlib.Path(os.path.join(STORE_DIR, "mcdata"))
 CONTEXT = Context(MAIN_DIR, WORK_DIR)
 GLOBAL_KILL = pathlib.Path(os.path.join(STORE_DIR, "GLOBAL_KILL"))
+VANILLA_INSTALLED = pathlib.Path(os.path.join(STORE_DIR, "VANILLA_INSTALLED"))
 
 if GLOBAL_KILL.exists():
     GLOBAL_KILL.unlink()
@@ -3,11 +3,15 @@ This module provides utility functions and classes for the application.
 
 Functions:
 - get_image: Get the image from the assets directory.
+- get_ctk_image: Get a resized image from the assets directory for use on a widget.
 - get_html_resp: Get the HTML response from the assets directory.
 - open_path: Open a folder or file on the users computer.
 - format_number: Format a float into correct measurement.
+- run_in_main_thread: Decorator that runs a widget method on the Tk main thread.
+- create_font: Create a CTkFont from a font setting.
 
 Classes:
+- GuiSnapshot: A read-only copy of the GUI settings used while building widgets.
 - Settings: A class that represents the settings for the application.
 - WrappingLabel: A custom label that wraps text.
 - PropagatingThread: A thread that propagates exceptions to the main thread.
@@ -15,6 +19,7 @@ Classes:
 Constants:
 - SETTINGS_FILENAME: The name of the settings file.
 - SETTINGS_PATH: The path to the settings file.
+- RAM_ARG_PATTERN: Matches a JVM heap size argument, used to migrate old settings.
 
 Variables:
 - gui_settings: The default GUI settings.
@@ -22,13 +27,18 @@ Variables:
 - game_settings: The default game settings.
 """
 
+import copy
+import dataclasses
+import functools
 import logging
 import os
 import subprocess
 import threading
 import platform
 import json
+import re
 import pathlib
+import tkinter
 import customtkinter
 from PIL import Image
 from source import path
@@ -37,6 +47,7 @@ logger = logging.getLogger(__name__)
 
 SETTINGS_FILENAME = "settings.json"
 SETTINGS_PATH = pathlib.Path(os.path.join(path.STORE_DIR, SETTINGS_FILENAME))
+RAM_ARG_PATTERN = re.compile(r"-Xm[sx](\d+)M")
 
 gui_settings = {
         "appearance": "system",
@@ -57,34 +68,54 @@ user_settings =  {
 
 game_settings = {
     "autojoin": True,
-    "ram_jvm_args": ["-Xms2048M", "-Xmx2048M"],
-    "additional_jvm_args": [
-    "-XX:+UnlockExperimentalVMOptions",
-    "-XX:+UseG1GC",
-    "-XX:G1NewSizePercent=20",
-    "-XX:G1ReservePercent=20",
-    "-XX:MaxGCPauseMillis=50",
-    "-XX:G1HeapRegionSize=32M"
-    ],
+    "ram_allocation": 2048,
+    "additional_jvm_args": (
+        "-XX:+UnlockExperimentalVMOptions "
+        "-XX:+UseG1GC "
+        "-XX:G1NewSizePercent=20 "
+        "-XX:G1ReservePercent=20 "
+        "-XX:MaxGCPauseMillis=50 "
+        "-XX:G1HeapRegionSize=32M"
+    ),
 }
 
 
+@dataclasses.dataclass(frozen=True)
+class GuiSnapshot:
+    """A read-only copy of the GUI settings used while building widgets."""
+    appearance: str
+    main_window_geometry: tuple
+    main_window_min_size: tuple
+    font_small: customtkinter.CTkFont
+    font_normal: customtkinter.CTkFont
+    font_large: customtkinter.CTkFont
+    font_title: customtkinter.CTkFont
+    image_small: tuple
+    image_normal: tuple
+    image_large: tuple
+
+
 class Settings:
     """
     A class that represents the settings for the application.
+    Only one instance is ever created, the settings file is read once and
+    cached in memory until reload is called.
 
     Properties:
     - path: The path to the settings file.
 
     Methods:
     - validate_settings: Validate the settings.
+    - migrate_settings: Convert settings written by older versions.
     - load: Reads the settings from a file.
+    - reload: Discards the cached settings and reads them from the file again.
     - save: Writes the settings to a file.
     - reset: Reset the settings to the default values.
     - reset_gui: Reset the GUI settings to the default values.
     - reset_user: Reset the user settings to the default values.
     - reset_game: Reset the game settings to the default values.
     - get_gui: Retrieves a specific GUI setting.
+    - snapshot_gui: Retrieves all GUI settings at once.
     - get_user: Retrieves a specific user setting.
     - get_game: Retrieves a specific game setting.
     - set_gui: Updates the GUI settings.
@@ -92,12 +123,17 @@ class Settings:
     - set_game: Updates the game settings.
     """
     _first_run = True
-
-    def __init__(self):
-        self._gui = None
-        self._user = None
-        self._game = None
-        self.load()
+    _instance = None
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+            cls._instance._gui = None
+            cls._instance._user = None
+            cls._instance._game = None
+            cls._instance._gui_snapshot = None
+            cls._instance.load()
+        return cls._instance
 
     @property
     def path(self) -> pathlib.Path:
@@ -132,11 +168,37 @@ class Settings:
                 logger.warning("Game setting '%s' is missing or invalid", key)
         return valid
 
+    def migrate_settings(self) -> bool:
+        """
+        Convert settings written by older versions to the current layout.
+
+        Returns:
+        - bool: True if any setting was converted, False otherwise.
+        """
+        migrated = False
+        if "ram_allocation" not in self._game and "ram_jvm_args" in self._game:
+            # Older versions stored the heap sizes as JVM arguments, keep the largest
+            sizes = []
+            for arg in self._game.pop("ram_jvm_args"):
+                match = RAM_ARG_PATTERN.fullmatch(arg)
+                if match:
+                    sizes.append(int(match.group(1)))
+            self._game["ram_allocation"] = max(sizes) if sizes else game_settings["ram_allocation"]
+            migrated = True
+            logger.info("Migrated 'ram_jvm_args' setting to 'ram_allocation'")
+        if isinstance(self._game.get("additional_jvm_args"), list):
+            # Older versions stored the arguments as a list, they are now kept as typed
+            self._game["additional_jvm_args"] = " ".join(self._game["additional_jvm_args"])
+            migrated = True
+            logger.info("Migrated 'additional_jvm_args' setting to a string")
+        return migrated
+
     def load(self):
         """
         Reads the settings from a file.
         If the file doesn't exist, default settings are used.
         """
+        self._gui_snapshot = None
         try:
             with open(SETTINGS_PATH, 'r', encoding="utf-8") as f:
                 data = json.load(f)
@@ -144,6 +206,9 @@ class Settings:
                 self._user = data['UserSettings']
                 self._game = data['GameSettings']
 
+            if self.migrate_settings():
+                self.save()
+
             if Settings._first_run:
                 if not self.validate_settings():
                     logger.warning("Settings file is corrupted.")
@@ -153,10 +218,18 @@ class Settings:
             logger.warning("Settings file not found or damaged.")
             self.reset()
 
+    def reload(self):
+        """
+        Discards the cached settings and reads them from the file again.
+        """
+        self.load()
+        logger.debug("Settings reloaded from file.")
+
     def save(self):
         """
         Writes the settings to a file.
         """
+        self._gui_snapshot = None  # The GUI settings may have changed
         data = {
             "GUISettings": self._gui,
             "UserSettings": self._user,
@@ -164,15 +237,14 @@ class Settings:
         }
         with open(SETTINGS_PATH, 'w', encoding="utf-8") as f:
             json.dump(data, f, indent=4)
-        self.load()
 
     def reset(self):
         """
         Reset the settings to the default values.
         """
-        self._gui = gui_settings
-        self._user = user_settings
-        self._game = game_settings
+        self._gui = copy.deepcopy(gui_settings)
+        self._user = copy.deepcopy(user_settings)
+        self._game = copy.deepcopy(game_settings)
         self.save()
         logger.debug("Settings reset to default values.")
 
@@ -180,7 +252,7 @@ class Settings:
         """
         Reset the GUI settings to the default values.
         """
-        self._gui = gui_settings
+        self._gui = copy.deepcopy(gui_settings)
         self.save()
         logger.info("GUI settings reset to default values.")
 
@@ -188,7 +260,7 @@ class Settings:
         """
         Reset the user settings to the default values.
         """
-        self._user = user_settings
+        self._user = copy.deepcopy(user_settings)
         self.save()
         logger.info("User settings reset to default values.")
 
@@ -196,7 +268,7 @@ class Settings:
         """
         Reset the game settings to the default values.
         """
-        self._game = game_settings
+        self._game = copy.deepcopy(game_settings)
         self.save()
         logger.info("Game settings reset to default values.")
 
@@ -210,12 +282,34 @@ class Settings:
         Returns:
         - Any: The value of the setting.
         """
-        self.load()
         # If the value is a list, return a tuple
         value = tuple(self._gui[key]) if isinstance(self._gui[key], list) else self._gui[key]
-        logger.debug("GUI setting '%s' retrieved value '%s'", key, value)
+        if logger.isEnabledFor(logging.DEBUG):  # Called for every widget that reads a setting
+            logger.debug("GUI setting '%s' retrieved value '%s'", key, value)
         return value
 
+    def snapshot_gui(self) -> GuiSnapshot:
+        """
+        Retrieves all GUI settings at once.
+        The snapshot is reused until the settings are saved or loaded again.
+        Fonts are created once per snapshot and shared by every widget, so a root
+        window must exist before this is called.
+
+        Returns:
+        - GuiSnapshot: The current GUI settings.
+        """
+        if self._gui_snapshot is None:
+            values = {}
+            for key in gui_settings:
+                value = self._gui[key]
+                if key.startswith("font_"):
+                    value = create_font(value)
+                elif isinstance(value, list):
+                    value = tuple(value)
+                values[key] = value
+            self._gui_snapshot = GuiSnapshot(**values)
+        return self._gui_snapshot
+
     def get_user(self, key: str) -> any:
         """
         Retrieves a specific user setting.
@@ -226,9 +320,9 @@ class Settings:
         Returns:
         - Any: The value of the setting.
         """
-        self.load()
         value = self._user[key]
-        logger.debug("User setting '%s' retrieved value '%s'", key, value)
+        if logger.isEnabledFor(logging.DEBUG):  # Called for every widget that reads a setting
+            logger.debug("User setting '%s' retrieved value '%s'", key, value)
         return value
 
     def get_game(self, key: str) -> any:
@@ -241,9 +335,9 @@ class Settings:
         Returns:
         - Any: The value of the setting.
         """
-        self.load()
         value = self._game[key]
-        logger.debug("Game setting '%s' retrieved value '%s'", key, value)
+        if logger.isEnabledFor(logging.DEBUG):  # Called for every widget that reads a setting
+            logger.debug("Game setting '%s' retrieved value '%s'", key, value)
         return value
 
     def set_gui(self, **kwargs) -> None:
@@ -311,9 +405,11 @@ class PropagatingThread(threading.Thread):
         return self.ret
 
 
+@functools.lru_cache(maxsize=None)
 def get_image(image_name: str) -> Image.Image:
     """
     Get the image from the assets directory.
+    Each image is decoded once and shared, callers must not modify it.
 
     Parameters:
     - image_name (str): The name of the image.
@@ -322,7 +418,8 @@ def get_image(image_name: str) -> Image.Image:
     - Image: The image.
     """
     try:
-        image = Image.open(path.ASSETS_DIR / "images" / image_name)
+        with Image.open(path.ASSETS_DIR / "images" / image_name) as image_file:
+            image = image_file.copy()  # Decode now so the file is closed
     except FileNotFoundError:
         logger.error("Image '%s' not found", image_name)
         raise
@@ -330,6 +427,22 @@ def get_image(image_name: str) -> Image.Image:
     return image
 
 
+@functools.lru_cache(maxsize=32)
+def get_ctk_image(image_name: str, size: tuple) -> customtkinter.CTkImage:
+    """
+    Get a resized image from the assets directory for use on a widget.
+    One image is created for each name and size, rebuilding a frame reuses it.
+
+    Parameters:
+    - image_name (str): The name of the image.
+    - size (tuple): The width and height of the image.
+
+    Returns:
+    - CTkImage: The image.
+    """
+    return customtkinter.CTkImage(get_image(image_name).resize(size))
+
+
 def get_html_resp() -> str:
     """
     Get the HTML response from the assets directory.
@@ -380,10 +493,68 @@ def format_number(number: float) -> str:
     Returns:
     - str: The formatted number
     """
+    # Drop the digits that are never shown so nearby values share a cache entry
     if number < 1000:
-        return f"{int(number)} "
+        return _format_whole_number(int(number))
+    return _format_whole_number(int(number // 100) * 100)
+
+
+@functools.lru_cache(maxsize=1024)
+def _format_whole_number(number: int) -> str:
+    """Format a whole number into correct measurement, see format_number."""
+    if number < 1000:
+        return f"{number} "
     if number < 1000000:
         return f"{(int(number / 100) / 10):.1f} k"
     if number < 1000000000:
         return f"{(int(number / 100000) / 10):.1f} M"
     return f"{(int(number / 100000000) / 10):.1f} G"
+
+
+def run_in_main_thread(func):
+    """
+    Decorator that runs a widget method on the Tk main thread.
+    Calls made from other threads are scheduled with after() and return None.
+    Scheduled calls are dropped if the widget was destroyed or the main loop has stopped.
+
+    Parameters:
+    - func: The widget method to wrap.
+
+    Returns:
+    - The wrapped method.
+    """
+    def run_if_exists(widget, *args, **kwargs):
+        if widget.winfo_exists():
+            func(widget, *args, **kwargs)
+
+    @functools.wraps(func)
+    def wrapper(self, *args, **kwargs):
+        if threading.current_thread() is threading.main_thread():
+            return func(self, *args, **kwargs)
+        try:
+            self.after(0, lambda: run_if_exists(self, *args, **kwargs))
+        except (RuntimeError, tkinter.TclError):  # The app was closed while the worker ran
+            logger.debug("Dropped %s, the main loop is not running", func.__name__)
+        return None
+    return wrapper
+
+
+def create_font(font: list) -> customtkinter.CTkFont:
+    """
+    Create a CTkFont from a font setting.
+
+    Parameters:
+    - font (list): The family, the size, and optionally styles such as 'bold' or 'italic'.
+
+    Returns:
+    - CTkFont: The font.
+    """
+    family, size, *styles = font
+    return customtkinter.CTkFont(
+        family=family,
+        size=size,
+        weight="bold" if "bold" in styles else "normal",
+        slant="italic" if "italic" in styles else "roman",
+        underline="underline" in styles,
+        overstrike="overstrike" in styles,
+    )